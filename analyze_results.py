@@ -1,29 +1,78 @@
 #!/usr/bin/env python3
 """Analyze benchmark results and calculate statistics"""
 
-import statistics
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional; fall back to the plain Python kernel
+    numba = None
+
+try:
+    import analyze_stats  # AOT-compiled kernel, built by analyze_stats_aot.py
+except ImportError:
+    analyze_stats = None
+
+
+def _stats_kernel(arr):
+    """Single-pass (Welford) mean, sample std dev, min and max of arr"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    lo = math.inf
+    hi = -math.inf
+
+    for x in arr:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+
+    std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+    return mean, std, lo, hi
+
+
+if numba is not None:
+    _stats_kernel = numba.njit(cache=True)(_stats_kernel)
+
+SEP_EQ = "=" * 70
+SEP_DASH = "-" * 70
+
 
 def analyze_results(problem_name, optimal, without, with2opt, with3opt):
     """Analyze and print statistics for a benchmark run"""
 
-    print(f"\n{'='*70}")
-    print(f"RESULTS: {problem_name} (Optimal: {optimal})")
-    print(f"{'='*70}\n")
+    print(f"\n{SEP_EQ}\nRESULTS: {problem_name} (Optimal: {optimal})\n{SEP_EQ}\n")
+
+    inv_opt = 100.0 / optimal
 
     def calc_stats(results, label):
-        avg = statistics.mean(results)
-        std = statistics.stdev(results) if len(results) > 1 else 0
-        best = min(results)
-        worst = max(results)
-        gap_avg = ((avg - optimal) / optimal) * 100
-        gap_best = ((best - optimal) / optimal) * 100
-
-        print(f"{label}:")
-        print(f"  Average:  {avg:8.2f}  ({gap_avg:+6.2f}% from optimal)")
-        print(f"  Best:     {best:8.2f}  ({gap_best:+6.2f}% from optimal)")
-        print(f"  Worst:    {worst:8.2f}  ({((worst - optimal) / optimal) * 100:+6.2f}% from optimal)")
-        print(f"  Std Dev:  {std:8.2f}")
-        print()
+        a = np.asarray(results, dtype=np.float64)
+
+        if analyze_stats is not None:
+            (avg, std, best, worst,
+             gap_avg, gap_best, gap_worst) = analyze_stats.stats(a, float(optimal))
+        else:
+            avg, std, best, worst = _stats_kernel(a)
+
+            # Gap from optimal for every run at once, then reduce
+            gaps = (a - optimal) * inv_opt
+            gap_avg = float(gaps.mean())
+            gap_best = float(gaps.min())
+            gap_worst = float(gaps.max())
+
+        print(f"""{label}:
+  Average:  {avg:8.2f}  ({gap_avg:+6.2f}% from optimal)
+  Best:     {best:8.2f}  ({gap_best:+6.2f}% from optimal)
+  Worst:    {worst:8.2f}  ({gap_worst:+6.2f}% from optimal)
+  Std Dev:  {std:8.2f}
+""")
 
         return avg, best, gap_avg
 
@@ -32,15 +81,16 @@ def analyze_results(problem_name, optimal, without, with2opt, with3opt):
     avg_3opt, best_3opt, gap_3opt = calc_stats(with3opt, "WITH 2-opt + 3-opt")
 
     print("IMPROVEMENTS:")
-    print("-" * 70)
-    imp_2opt = ((avg_without - avg_2opt) / avg_without) * 100
-    imp_3opt = ((avg_without - avg_3opt) / avg_without) * 100
-    imp_3opt_vs_2opt = ((avg_2opt - avg_3opt) / avg_2opt) * 100
-
-    print(f"  2-opt only vs baseline:     {imp_2opt:6.2f}% improvement")
-    print(f"  2-opt+3-opt vs baseline:    {imp_3opt:6.2f}% improvement")
-    print(f"  2-opt+3-opt vs 2-opt only:  {imp_3opt_vs_2opt:6.2f}% improvement")
-    print()
+    print(SEP_DASH)
+    # baseline -> 2-opt, baseline -> 2-opt+3-opt, 2-opt -> 2-opt+3-opt in one pass
+    avgs = np.array([avg_without, avg_2opt, avg_3opt])
+    base = avgs[[0, 0, 1]]
+    imp_2opt, imp_3opt, imp_3opt_vs_2opt = ((base - avgs[[1, 2, 2]]) / base * 100).tolist()
+
+    print(f"""  2-opt only vs baseline:     {imp_2opt:6.2f}% improvement
+  2-opt+3-opt vs baseline:    {imp_3opt:6.2f}% improvement
+  2-opt+3-opt vs 2-opt only:  {imp_3opt_vs_2opt:6.2f}% improvement
+""")
 
     return {
         'problem': problem_name,
@@ -89,12 +139,19 @@ if __name__ == "__main__":
     print(f"{'Problem':<15} {'Optimal':>8} {'Without LS':>15} {'2-opt Only':>15} {'2-opt+3-opt':>15} {'Improv':>8}")
     print("-"*90)
 
-    for r in results:
-        print(f"{r['problem']:<15} {r['optimal']:>8} "
-              f"{r['without'][0]:>8.1f}({r['without'][1]:+5.1f}%) "
-              f"{r['2opt'][0]:>8.1f}({r['2opt'][1]:+5.1f}%) "
-              f"{r['3opt'][0]:>8.1f}({r['3opt'][1]:+5.1f}%) "
-              f"{r['improvement']:>7.1f}%")
+    # One row per problem: (without, 2-opt, 3-opt) averages and gaps as arrays
+    avgs = np.array([[r['without'][0], r['2opt'][0], r['3opt'][0]] for r in results])
+    gaps = np.array([[r['without'][1], r['2opt'][1], r['3opt'][1]] for r in results])
+    imp = (avgs[:, :1] - avgs) / avgs[:, :1] * 100
+
+    print("\n".join(
+        f"{r['problem']:<15} {r['optimal']:>8} "
+        f"{a[0]:>8.1f}({g[0]:+5.1f}%) "
+        f"{a[1]:>8.1f}({g[1]:+5.1f}%) "
+        f"{a[2]:>8.1f}({g[2]:+5.1f}%) "
+        f"{i:>7.1f}%"
+        for r, a, g, i in zip(results, avgs.tolist(), gaps.tolist(), imp[:, 2].tolist())
+    ))
 
     print("\nNote: All values are averages over 5 runs")
     print("Configuration: 100 iterations, 30 ants")
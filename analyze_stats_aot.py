@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Ahead-of-time compile the analyze_results statistics kernel with Numba
+
+Usage:
+    python analyze_stats_aot.py
+
+Builds the analyze_stats extension module next to this file. When it is
+present, analyze_results.py uses it and skips Numba's JIT warmup entirely.
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+from analyze_results import _stats_kernel
+
+cc = CC('analyze_stats')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('stats', 'f8[:](f8[:], f8)')
+def stats(results, optimal):
+    """[avg, std, best, worst, gap_avg, gap_best, gap_worst] for one run list"""
+    avg, std, best, worst = _stats_kernel(results)
+    inv_opt = 100.0 / optimal
+
+    out = np.empty(7)
+    out[0] = avg
+    out[1] = std
+    out[2] = best
+    out[3] = worst
+    out[4] = (avg - optimal) * inv_opt
+    out[5] = (best - optimal) * inv_opt
+    out[6] = (worst - optimal) * inv_opt
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,30 +1,201 @@
 """Flask API with WebSocket support for ACO TSP Solver"""
 
-from flask import Flask, jsonify, request
+import os
+
+# eventlet must patch the standard library before anything else imports it,
+# config included, so the mode is read from the environment variable that
+# Config.SOCKETIO_ASYNC_MODE also uses
+if os.environ.get('SOCKETIO_ASYNC_MODE', 'eventlet') == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
+from config import (Config, BENCHMARKS, BENCHMARK_CITIES, BENCHMARK_NAMES,
+                    BENCHMARK_OPTIMAL, CORS_ORIGINS, DATA_DIR, DEFAULT_PARAMS)
+from flask import Flask, Response, request
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import traceback
+from flask_compress import Compress
+import atexit
+import functools
+import hashlib
+import logging
+import logging.handlers
+import orjson
+import queue
+import sys
 
-from config import Config
 from solver_manager import SolverManager
 
+# Logging: request handlers only enqueue records, a listener thread writes them
+logger = logging.getLogger('aco')
+logger.setLevel(logging.DEBUG if Config.DEBUG else logging.INFO)
+logger.propagate = False
+
+_log_queue = queue.Queue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
 
 # Enable CORS
-CORS(app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS}})
+# Flask-CORS normalizes origins into a list of patterns, so hand it one
+CORS(app, resources={r"/api/*": {"origins": sorted(CORS_ORIGINS)}})
+
+# Compress JSON responses (Brotli when the client accepts it, gzip otherwise)
+Compress(app)
+
+
+class _OrjsonModule:
+    """json-module shim so python-socketio encodes packets with orjson"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson output is already compact, so `separators` is ignored
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
 
 # Initialize SocketIO
 socketio = SocketIO(
     app,
     cors_allowed_origins=Config.SOCKETIO_CORS_ALLOWED_ORIGINS,
-    async_mode=Config.SOCKETIO_ASYNC_MODE
+    async_mode=Config.SOCKETIO_ASYNC_MODE,
+    json=_OrjsonModule,
+    # Compress long-polling payloads (e.g. preview_loaded city lists); the
+    # eventlet WebSocket server negotiates permessage-deflate on its own
+    http_compression=True,
+    compression_threshold=Config.SOCKETIO_COMPRESSION_THRESHOLD
 )
 
 # Global solver manager
 solver_manager = SolverManager(socketio)
 
+# ============================================================================
+# Precomputed Responses
+# ============================================================================
+
+def ojson(payload, status=200):
+    """JSON response encoded with orjson (drop-in for jsonify)"""
+    return Response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+                    status=status, mimetype='application/json')
+
+
+def _json_body(payload):
+    """Serialize payload once and return (body bytes, ETag)"""
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return body, hashlib.sha1(body).hexdigest()
+
+
+def _cached_json_response(cached):
+    """Build a cacheable JSON response from a precomputed (body, etag) pair"""
+    body, etag = cached
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    # Answers 304 Not Modified when the client's If-None-Match matches
+    return response.make_conditional(request)
+
+
+_HEALTH_JSON = _json_body({
+    'status': 'healthy',
+    'service': 'ACO TSP Solver API',
+    'version': '1.0.0'
+})
+
+_PARAMS_JSON = _json_body({
+    'parameters': DEFAULT_PARAMS,
+    'descriptions': {
+        'numAnts': 'Number of ants in the colony',
+        'iterations': 'Number of optimization iterations',
+        'alpha': 'Pheromone importance factor (higher = more pheromone influence)',
+        'beta': 'Heuristic importance factor (higher = more distance influence)',
+        'rho': 'Evaporation rate (0-1, higher = faster evaporation)',
+        'Q': 'Pheromone deposit factor',
+        'useParallel': 'Enable multi-threaded execution (requires OpenMP)',
+        'numThreads': 'Number of threads (0=auto-detect, 1=serial, 2+=specific count)',
+        'useLocalSearch': 'Enable 2-opt/3-opt local search for better solution quality',
+        'use3Opt': 'Use both 2-opt and 3-opt (disable for 2-opt only)',
+        'localSearchMode': 'When to apply local search (best=best tour only, all=all ant tours, none=disabled)'
+    }
+})
+
+def _data_dir_mtime():
+    """Modification time of DATA_DIR, used to invalidate on-disk caches"""
+    # One stat() of the directory instead of one per benchmark file
+    try:
+        return DATA_DIR.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+# Benchmarks available on disk, rebuilt only when DATA_DIR changes
+_BENCHMARKS_CACHE = None
+_BENCHMARKS_CACHE_MTIME = None
+
+
+def _available_benchmarks():
+    """Return the serialized benchmark listing for DATA_DIR (memoized)"""
+    global _BENCHMARKS_CACHE, _BENCHMARKS_CACHE_MTIME
+
+    mtime = _data_dir_mtime()
+    if _BENCHMARKS_CACHE is None or mtime != _BENCHMARKS_CACHE_MTIME:
+        # The benchmark arrays are already sorted by number of cities
+        benchmarks = [
+            {'name': name, 'cities': cities, 'optimal': optimal}
+            for name, cities, optimal in zip(BENCHMARK_NAMES,
+                                             BENCHMARK_CITIES.tolist(),
+                                             BENCHMARK_OPTIMAL.tolist())
+            if (DATA_DIR / name).exists()
+        ]
+
+        _BENCHMARKS_CACHE = _json_body({
+            'benchmarks': benchmarks,
+            'count': len(benchmarks)
+        })
+        _BENCHMARKS_CACHE_MTIME = mtime
+
+    return _BENCHMARKS_CACHE
+
+
+# _benchmark_info_json() result for a known benchmark whose file is missing
+_FILE_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _benchmark_info_json(benchmark_name, data_dir_mtime):
+    """Serialized info for a benchmark
+
+    Returns None for an unknown benchmark and _FILE_MISSING if its file is
+    not in DATA_DIR. data_dir_mtime is only part of the cache key, so entries
+    are recomputed after files are added to or removed from DATA_DIR.
+    """
+    metadata = BENCHMARKS.get(benchmark_name)
+    if metadata is None:
+        return None
+
+    filepath = DATA_DIR / benchmark_name
+    if not filepath.exists():
+        return _FILE_MISSING
+
+    return _json_body({
+        'name': benchmark_name,
+        'cities': metadata['cities'],
+        'optimal': metadata['optimal'],
+        'filepath': str(filepath)
+    })
+
+
 # ============================================================================
 # REST Endpoints
 # ============================================================================
@@ -32,74 +203,31 @@ solver_manager = SolverManager(socketio)
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'ACO TSP Solver API',
-        'version': '1.0.0'
-    })
+    return _cached_json_response(_HEALTH_JSON)
 
 
 @app.route('/api/benchmarks', methods=['GET'])
 def list_benchmarks():
     """List available TSPLIB benchmark problems"""
-    benchmarks = []
-
-    for filename, metadata in Config.BENCHMARKS.items():
-        filepath = Config.DATA_DIR / filename
-        if filepath.exists():
-            benchmarks.append({
-                'name': filename,
-                'cities': metadata['cities'],
-                'optimal': metadata['optimal']
-            })
-
-    # Sort by number of cities
-    benchmarks.sort(key=lambda x: x['cities'])
-
-    return jsonify({
-        'benchmarks': benchmarks,
-        'count': len(benchmarks)
-    })
+    return _cached_json_response(_available_benchmarks())
 
 
 @app.route('/api/benchmarks/<benchmark_name>', methods=['GET'])
 def get_benchmark_info(benchmark_name):
     """Get information about a specific benchmark"""
-    if benchmark_name not in Config.BENCHMARKS:
-        return jsonify({'error': 'Benchmark not found'}), 404
-
-    filepath = Config.DATA_DIR / benchmark_name
-    if not filepath.exists():
-        return jsonify({'error': 'Benchmark file not found on disk'}), 404
+    cached = _benchmark_info_json(benchmark_name, _data_dir_mtime())
+    if cached is None:
+        return ojson({'error': 'Benchmark not found'}, 404)
+    if cached is _FILE_MISSING:
+        return ojson({'error': 'Benchmark file not found on disk'}, 404)
 
-    metadata = Config.BENCHMARKS[benchmark_name]
-    return jsonify({
-        'name': benchmark_name,
-        'cities': metadata['cities'],
-        'optimal': metadata['optimal'],
-        'filepath': str(filepath)
-    })
+    return _cached_json_response(cached)
 
 
 @app.route('/api/parameters', methods=['GET'])
 def get_default_parameters():
     """Get default ACO parameters"""
-    return jsonify({
-        'parameters': Config.DEFAULT_PARAMS,
-        'descriptions': {
-            'numAnts': 'Number of ants in the colony',
-            'iterations': 'Number of optimization iterations',
-            'alpha': 'Pheromone importance factor (higher = more pheromone influence)',
-            'beta': 'Heuristic importance factor (higher = more distance influence)',
-            'rho': 'Evaporation rate (0-1, higher = faster evaporation)',
-            'Q': 'Pheromone deposit factor',
-            'useParallel': 'Enable multi-threaded execution (requires OpenMP)',
-            'numThreads': 'Number of threads (0=auto-detect, 1=serial, 2+=specific count)',
-            'useLocalSearch': 'Enable 2-opt/3-opt local search for better solution quality',
-            'use3Opt': 'Use both 2-opt and 3-opt (disable for 2-opt only)',
-            'localSearchMode': 'When to apply local search (best=best tour only, all=all ant tours, none=disabled)'
-        }
-    })
+    return _cached_json_response(_PARAMS_JSON)
 
 
 # ============================================================================
@@ -109,7 +237,7 @@ def get_default_parameters():
 @socketio.on('connect')
 def handle_connect():
     """Client connected"""
-    print('Client connected')
+    logger.info('Client connected')
     emit('connected', {
         'message': 'Connected to ACO TSP Solver',
         'version': '1.0.0'
@@ -119,56 +247,63 @@ def handle_connect():
 @socketio.on('disconnect')
 def handle_disconnect():
     """Client disconnected"""
-    print('Client disconnected')
-    solver_manager.stop()
+    logger.info('Client disconnected')
+    solver_manager.stop(request.sid)
 
 
 @socketio.on('solve')
 def handle_solve(data):
     """Start solving TSP problem"""
+    # Solve in a background task so the server keeps handling other events
+    socketio.start_background_task(_run_solve, request.sid, data)
+
+
+def _run_solve(sid, data):
+    """Load the benchmark and run the solver, reporting back to client sid"""
     try:
         # Extract request data
         benchmark = data.get('benchmark')
         params = data.get('params', {})
 
         if not benchmark:
-            emit('error', {'message': 'No benchmark specified'})
+            socketio.emit('error', {'message': 'No benchmark specified'}, to=sid)
             return
 
-        print(f"Received solve request for: {benchmark}")
-        print(f"Parameters: {params}")
+        logger.info("Received solve request for: %s", benchmark)
+        logger.info("Parameters: %s", params)
 
         # Load benchmark
         load_result = solver_manager.load_benchmark(benchmark)
 
         # Send initial data
-        emit('loaded', {
+        socketio.emit('loaded', {
             'benchmark': benchmark,
             'numCities': load_result['numCities'],
             'cities': load_result['cities']
-        })
+        }, to=sid)
 
-        print(f"Loaded {benchmark}: {load_result['numCities']} cities")
+        logger.info("Loaded %s: %d cities", benchmark, load_result['numCities'])
 
         # Run solver (progress updates sent via callbacks)
-        result = solver_manager.solve(params)
+        result = solver_manager.solve(benchmark, params, sid)
 
-        print(f"Optimization complete: {result['bestDistance']:.2f} in {result['elapsedTime']:.2f}s")
+        logger.info("Optimization complete: %.2f in %dms",
+                    result['bestDistance'], result['elapsedMs'])
 
         # Send final result
-        emit('complete', result)
+        socketio.emit('complete', result, to=sid)
 
     except FileNotFoundError as e:
-        print(f"File not found: {e}")
-        emit('error', {'message': f'Benchmark not found: {str(e)}'})
+        logger.warning("File not found: %s", e)
+        socketio.emit('error', {'message': f'Benchmark not found: {str(e)}'}, to=sid)
 
     except ValueError as e:
-        print(f"Value error: {e}")
-        emit('error', {'message': f'Invalid data: {str(e)}'})
+        logger.warning("Value error: %s", e)
+        socketio.emit('error', {'message': f'Invalid data: {str(e)}'}, to=sid)
 
     except Exception as e:
-        print(f"Error in solve: {traceback.format_exc()}")
-        emit('error', {'message': f'Server error: {str(e)}'})
+        logger.exception("Error in solve")
+        socketio.emit('error', {'message': f'Server error: {str(e)}'}, to=sid)
 
 
 @socketio.on('preview')
@@ -181,7 +316,7 @@ def handle_preview(data):
             emit('error', {'message': 'No benchmark specified'})
             return
 
-        print(f"Received preview request for: {benchmark}")
+        logger.info("Received preview request for: %s", benchmark)
 
         # Load benchmark
         load_result = solver_manager.load_benchmark(benchmark)
@@ -193,23 +328,23 @@ def handle_preview(data):
             'cities': load_result['cities']
         })
 
-        print(f"Preview loaded: {benchmark} with {load_result['numCities']} cities")
+        logger.info("Preview loaded: %s with %d cities", benchmark, load_result['numCities'])
 
     except FileNotFoundError as e:
-        print(f"File not found: {e}")
+        logger.warning("File not found: %s", e)
         emit('error', {'message': f'Benchmark not found: {str(e)}'})
 
     except Exception as e:
-        print(f"Error in preview: {traceback.format_exc()}")
+        logger.exception("Error in preview")
         emit('error', {'message': f'Server error: {str(e)}'})
 
 
 @socketio.on('cancel')
 def handle_cancel():
     """Cancel running optimization"""
-    solver_manager.stop()
+    solver_manager.stop(request.sid)
     emit('cancelled', {'message': 'Optimization cancelled'})
-    print('Optimization cancelled by client')
+    logger.info('Optimization cancelled by client')
 
 
 # ============================================================================
@@ -219,13 +354,13 @@ def handle_cancel():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({'error': 'Not found'}), 404
+    return ojson({'error': 'Not found'}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojson({'error': 'Internal server error'}, 500)
 
 
 # ============================================================================
@@ -236,8 +371,8 @@ if __name__ == '__main__':
     print("=" * 60)
     print("ACO TSP Solver - Flask Backend with WebSocket Support")
     print("=" * 60)
-    print(f"CORS origins: {Config.CORS_ORIGINS}")
-    print(f"Data directory: {Config.DATA_DIR}")
+    print(f"CORS origins: {CORS_ORIGINS}")
+    print(f"Data directory: {DATA_DIR}")
     print(f"Debug mode: {Config.DEBUG}")
     print(f"Async mode: {Config.SOCKETIO_ASYNC_MODE}")
     print("=" * 60)
@@ -249,7 +384,7 @@ if __name__ == '__main__':
     print("\nWebSocket Events:")
     print("  connect -> connected")
     print("  preview -> preview_loaded (load cities without solving)")
-    print("  solve -> loaded, progress (every 10 iter), complete")
+    print("  solve -> loaded, progress_batch (~10 Hz), complete")
     print("  cancel -> cancelled")
     print("  disconnect")
     print("=" * 60)
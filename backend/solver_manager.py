@@ -1,86 +1,265 @@
 """Bridge between Flask and C++ ACO solver"""
 
+import collections
+import dataclasses
+import logging
+import os
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
+
+import numpy as np
 
 # Add python_bindings to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'python_bindings'))
 
 import aco_solver
-from config import Config
+from graph_cache import get_graph
+from config import (BENCHMARKS, DATA_DIR, DEFAULT_PARAMS, GRAPH_CACHE_DIR, GRAPH_CACHE_MAX_CITIES,
+                    GRAPH_MEMORY_CACHE_BYTES)
+
+# Child of the app's 'aco' logger, so records go through its queue handler
+logger = logging.getLogger('aco.solver_manager')
+
+# Seconds between progress_batch emits (caps the frame rate at ~10 Hz)
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Iterations covered by each progress update within a batch (at least)
+PROGRESS_ITERATION_INTERVAL = 10
+
+# Upper bound on progress updates per fixed-length solve; longer runs
+# report less often so the payload rate stays roughly constant
+PROGRESS_MAX_UPDATES = 200
+
+
+def _available_cpus():
+    """CPUs this process may run on (respects taskset/cgroup CPU affinity)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+# Thread count used when a solve asks for numThreads=0 (auto)
+AVAILABLE_CPUS = _available_cpus()
+
+
+def _load_graph(filepath):
+    """Load a benchmark graph, through the on-disk graph cache when enabled
+
+    See graph_cache.get_graph(); only GRAPH_CACHE_MAX_CITIES and smaller
+    benchmarks are written to GRAPH_CACHE_DIR.
+    """
+    if GRAPH_CACHE_DIR is None:
+        # Load graph using TSPLoader (auto-searches data/ directories)
+        return aco_solver.TSPLoader(str(filepath)).loadGraph()
+    return get_graph(filepath, GRAPH_CACHE_DIR, GRAPH_CACHE_MAX_CITIES)
+
+
+def _graph_bytes(graph):
+    """Approximate memory held by a graph (dominated by its n×n distance matrix)"""
+    return 8 * graph.getNumCities() ** 2
+
+
+class _GraphCache:
+    """LRU cache of loaded benchmarks, bounded by the bytes their graphs hold"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        # name -> (graph, cities_coords, optimal, inv_optimal, nbytes)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, benchmark_name):
+        """Return the cached (graph, cities_coords, optimal, inv_optimal), or None"""
+        with self._lock:
+            entry = self._entries.get(benchmark_name)
+            if entry is None:
+                return None
+            self._entries.move_to_end(benchmark_name)
+            return entry[:4]
+
+    def put(self, benchmark_name, graph, cities_coords, optimal, inv_optimal):
+        """Cache a loaded benchmark, evicting the least recently used ones to fit"""
+        nbytes = _graph_bytes(graph)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(benchmark_name, None)
+            if old is not None:
+                self.nbytes -= old[-1]
+            while self._entries and self.nbytes + nbytes > self.max_bytes:
+                self.nbytes -= self._entries.popitem(last=False)[1][-1]
+            self._entries[benchmark_name] = (graph, cities_coords, optimal, inv_optimal, nbytes)
+            self.nbytes += nbytes
+
+
+@dataclasses.dataclass(slots=True)
+class SolveParams:
+    """Solve request parameters (field names match the client's camelCase keys)"""
+    numAnts: Optional[int] = None           # None = auto from problem size
+    iterations: int = DEFAULT_PARAMS['iterations']
+    alpha: float = DEFAULT_PARAMS['alpha']
+    beta: float = DEFAULT_PARAMS['beta']
+    rho: float = DEFAULT_PARAMS['rho']
+    Q: float = DEFAULT_PARAMS['Q']
+    useConvergence: bool = False
+    convergenceIterations: int = 200
+    useParallel: bool = DEFAULT_PARAMS['useParallel']
+    numThreads: int = DEFAULT_PARAMS['numThreads']
+    useLocalSearch: bool = False
+    use3Opt: Optional[bool] = None          # None = auto from problem size
+    localSearchMode: Optional[str] = None   # None = auto from problem size
+    useElitist: bool = False
+    elitistWeight: Optional[float] = None   # None = use default (numAnts)
+    pheromoneMode: str = 'all'
+    rankSize: Optional[int] = None          # None = use default (numAnts/2)
+
+    @classmethod
+    def from_dict(cls, params):
+        """Build from a request dict, ignoring keys the solver does not know"""
+        return cls(**{k: v for k, v in params.items() if k in _SOLVE_PARAM_NAMES})
+
+
+_SOLVE_PARAM_NAMES = frozenset(f.name for f in dataclasses.fields(SolveParams))
+
+
+@dataclasses.dataclass(slots=True)
+class _SolveRun:
+    """Progress state of one solve (concurrent solves each get their own)"""
+    colony: aco_solver.AntColony
+    sid: Optional[str]                  # Client that receives the progress (None = all)
+    progress_total: Optional[int]       # Iterations for progressPermille (None = convergence mode)
+    report_interval: int
+    warnings: Optional[list] = None     # Configuration warnings for the first progress batch
+    is_running: bool = True             # False once cancelled: drain, but stop emitting
+    emitting: bool = True               # False once solve() returns: flush one last time
+    best_tour: Optional[list] = None    # Newest improved tour not yet emitted
+    # Running global bests (cumulative minimum of the iteration bests)
+    running_best: float = float('inf')
+    global_bests: list = dataclasses.field(default_factory=list)
+    # Drained records (and their global bests) not yet sent in an update
+    pending_records: Optional[np.ndarray] = None
+    pending_delta: list = dataclasses.field(default_factory=list)
+    last_iteration: int = 0             # Last iteration drained from the progress buffer
+    progress_gap: bool = False          # True if the buffer overflowed and dropped records
+
+    def append_global_bests(self, new_bests):
+        """Append running global bests for new iteration bests; return the new ones"""
+        # Cumulative minimum of the new iteration bests, capped by the best so far
+        delta = np.minimum.accumulate(np.asarray(new_bests, dtype=np.float64))
+        if delta.size:
+            np.minimum(delta, self.running_best, out=delta)
+            self.running_best = float(delta[-1])
+
+        delta = delta.tolist()
+        self.global_bests.extend(delta)
+        return delta
 
 
 class SolverManager:
-    """Manages ACO solver execution with progress callbacks"""
+    """Manages ACO solver execution and streams its progress"""
 
     def __init__(self, socketio):
         self.socketio = socketio
-        self.graph = None
-        self.cities_coords = []
-        self.benchmark_name = None
-        self.start_time = None
-        self.is_running = False
-
-    def load_benchmark(self, benchmark_name):
-        """Load TSPLIB benchmark file"""
-        filepath = Config.DATA_DIR / benchmark_name
+        # Idle colony reused by the next solve on the same graph with the same
+        # ant count. A solve checks it out under the lock and puts it back when
+        # done, so two concurrent solves never share one
+        self._colony_lock = threading.Lock()
+        self._colony = None
+        self._colony_key = None
+        # Active solves by client sid, so a cancel only stops that client's run.
+        # Everything else a solve needs lives in its own _SolveRun
+        self._runs = {}
+        self._graphs = _GraphCache(GRAPH_MEMORY_CACHE_BYTES)
+
+    def _load_impl(self, benchmark_name):
+        """Load a benchmark from disk (cached: parsing + O(n²) distance matrix)
+
+        Returns (graph, cities_coords, optimal, inv_optimal). The graph and
+        coordinates are shared between callers and must be treated as
+        read-only. Graphs stay cached up to GRAPH_MEMORY_CACHE_BYTES in total.
+        """
+        cached = self._graphs.get(benchmark_name)
+        if cached is not None:
+            return cached
+
+        filepath = DATA_DIR / benchmark_name
 
         if not filepath.exists():
             raise FileNotFoundError(f"Benchmark {benchmark_name} not found at {filepath}")
 
-        # Load graph using TSPLoader (auto-searches data/ directories)
-        loader = aco_solver.TSPLoader(str(filepath))
-        self.graph = loader.loadGraph()
+        graph = _load_graph(filepath)
 
-        if not self.graph.isValid():
+        if not graph.isValid():
             raise ValueError(f"Failed to load graph from {benchmark_name}")
 
-        # Extract city coordinates for frontend visualization
-        self.cities_coords = [
-            [city.getX(), city.getY()]
-            for city in self.graph.getCities()
-        ]
+        # City coordinates for frontend visualization. The graph stores them
+        # planar ([xs | ys]), so coordsView() is column-strided, and orjson
+        # only serializes C-order arrays. This is the one row-major copy,
+        # made once per load and cached with the graph
+        cities_coords = np.ascontiguousarray(graph.coordsView())
+        cities_coords.flags.writeable = False
 
-        self.benchmark_name = benchmark_name
+        # Resolve the optimum once per load instead of on every solve
+        optimal = BENCHMARKS.get(benchmark_name, {}).get('optimal')
+        inv_optimal = 1.0 / optimal if optimal else None
+
+        self._graphs.put(benchmark_name, graph, cities_coords, optimal, inv_optimal)
+        return graph, cities_coords, optimal, inv_optimal
+
+    def load_benchmark(self, benchmark_name):
+        """Load TSPLIB benchmark file"""
+        graph, cities_coords, _, _ = self._load_impl(benchmark_name)
 
         return {
-            'numCities': self.graph.getNumCities(),
-            'cities': self.cities_coords,
+            'numCities': graph.getNumCities(),
+            'cities': cities_coords,
             'benchmark': benchmark_name
         }
 
-    def solve(self, params):
-        """Run ACO solver with progress callbacks"""
-        if self.graph is None or not self.graph.isValid():
-            raise RuntimeError("No valid graph loaded")
+    def solve(self, benchmark_name, params, sid=None):
+        """Run ACO solver on a benchmark, streaming progress to client sid
+
+        Several solves may run at once (one per client); each keeps its
+        state in its own _SolveRun.
+        """
+        graph, _, optimal_distance, inv_optimal = self._load_impl(benchmark_name)
+        num_cities = graph.getNumCities()
 
-        num_cities = self.graph.getNumCities()
+        # Extract parameters with defaults (one pass over the request dict)
+        p = SolveParams.from_dict(params)
 
-        # Extract parameters with defaults
-        num_ants = params.get('numAnts')
+        num_ants = p.numAnts
         if num_ants is None:
             # Auto-calculate based on problem size (heuristic: 1-2 ants per city)
             num_ants = max(10, min(100, num_cities))
 
-        iterations = params.get('iterations', Config.DEFAULT_PARAMS['iterations'])
-        alpha = params.get('alpha', Config.DEFAULT_PARAMS['alpha'])
-        beta = params.get('beta', Config.DEFAULT_PARAMS['beta'])
-        rho = params.get('rho', Config.DEFAULT_PARAMS['rho'])
-        Q = params.get('Q', Config.DEFAULT_PARAMS['Q'])
+        iterations = p.iterations
+        alpha = p.alpha
+        beta = p.beta
+        rho = p.rho
+        Q = p.Q
 
         # Convergence criterion
-        use_convergence = params.get('useConvergence', False)
-        convergence_iterations = params.get('convergenceIterations', 200)
+        use_convergence = p.useConvergence
+        convergence_iterations = p.convergenceIterations
 
         # Threading parameters
-        use_parallel = params.get('useParallel', Config.DEFAULT_PARAMS['useParallel'])
-        num_threads = params.get('numThreads', Config.DEFAULT_PARAMS['numThreads'])
+        use_parallel = p.useParallel
+        num_threads = p.numThreads
+        if num_threads <= 0:
+            # Auto: one thread per usable CPU, but ants are the unit of
+            # parallel work, so threads beyond num_ants would only idle
+            num_threads = min(AVAILABLE_CPUS, num_ants)
 
         # Local search parameters - apply smart defaults based on problem size
-        use_local_search = params.get('useLocalSearch', False)
-        use_3opt_param = params.get('use3Opt')
-        local_search_mode_param = params.get('localSearchMode')
+        use_local_search = p.useLocalSearch
+        use_3opt_param = p.use3Opt
+        local_search_mode_param = p.localSearchMode
 
         # Smart defaults based on problem size
         # Small problems (<100 cities): can afford 3-opt + all mode
@@ -123,97 +302,59 @@ class SolverManager:
             warnings.append(f"Warning: 'all tours' mode is computationally expensive for {num_cities} cities. "
                           f"Each iteration may take 5-10+ seconds. Consider using 'best' mode instead.")
 
-        # Log configuration info
-        print(f"Configuration for {num_cities} cities:")
-        print(f"  - Ants: {num_ants}")
-        print(f"  - Local search: {use_local_search}")
+        # Log configuration info (one record, so concurrent solves don't interleave)
+        config_info = {'cities': num_cities, 'ants': num_ants, 'localSearch': use_local_search}
         if use_local_search:
-            print(f"  - Mode: {local_search_mode}")
-            print(f"  - 3-opt: {use_3opt}")
-            if use_3opt_param is None or local_search_mode_param is None:
-                print(f"  - (Auto-adjusted for problem size)")
+            config_info['mode'] = local_search_mode
+            config_info['3opt'] = use_3opt
+            config_info['autoAdjusted'] = use_3opt_param is None or local_search_mode_param is None
+        logger.info("Configuration: %s", config_info)
 
-        if warnings:
-            for warning in warnings:
-                print(warning)
-                # Emit warning to frontend
-                self.socketio.emit('warning', {'message': warning})
+        for warning in warnings:
+            logger.warning(warning)
 
         # Elitist strategy parameters
-        use_elitist = params.get('useElitist', False)
-        elitist_weight = params.get('elitistWeight')  # None = use default (numAnts)
-        pheromone_mode = params.get('pheromoneMode', 'all')
-        rank_size = params.get('rankSize')  # None = use default (numAnts/2)
-
-        # Create colony
-        colony = aco_solver.AntColony(
-            self.graph,
-            num_ants,
-            alpha,
-            beta,
-            rho,
-            Q
-        )
-
-        # Configure threading
-        colony.setUseParallel(use_parallel)
-        colony.setNumThreads(num_threads)
-
-        # Configure local search
-        colony.setUseLocalSearch(use_local_search)
-        colony.setUse3Opt(use_3opt)
-        colony.setLocalSearchMode(local_search_mode)
-
-        # Configure elitist strategy
-        colony.setUseElitist(use_elitist)
-        if elitist_weight is not None:
-            colony.setElitistWeight(elitist_weight)
-        colony.setPheromoneMode(pheromone_mode)
-        if rank_size is not None:
-            colony.setRankSize(rank_size)
-
-        # Initialize
-        colony.initialize()
-
-        # Set up progress callback
-        self.start_time = time.time()
-        self.is_running = True
-
-        def progress_callback(iteration, best_distance, best_tour, convergence):
-            """Called from C++ every N iterations"""
-            if not self.is_running:
-                return
-
-            elapsed = time.time() - self.start_time
-
-            # Calculate progress percentage
-            if use_convergence:
-                # For convergence mode, we don't know total iterations, so just show elapsed time
-                progress_pct = 0  # Indeterminate progress
-            else:
-                progress_pct = (iteration / iterations) * 100
-
-            # Convert iteration bests to running global bests for convergence graph
-            global_bests = []
-            running_best = float('inf')
-            for dist in convergence:
-                running_best = min(running_best, dist)
-                global_bests.append(running_best)
-
-            # Emit progress update via WebSocket
-            self.socketio.emit('progress', {
-                'iteration': iteration,
-                'bestDistance': best_distance,
-                'bestTour': best_tour,
-                'convergenceHistory': global_bests,
-                'cities': self.cities_coords,
-                'elapsedTime': round(elapsed, 2),
-                'progress': round(progress_pct, 1)
-            })
-
-        # Set callback interval (every 10 iterations by default)
-        colony.setProgressCallback(progress_callback)
-        colony.setCallbackInterval(10)
+        use_elitist = p.useElitist
+        elitist_weight = p.elitistWeight
+        pheromone_mode = p.pheromoneMode
+        rank_size = p.rankSize
+
+        # Reuse the colony (and its copy of the graph) when only the ACO
+        # parameters changed; a new graph or ant count needs a new one. Keyed
+        # by name, so the idle colony does not also pin an evicted graph
+        colony_key = (benchmark_name, num_ants)
+        colony = self._checkout_colony(colony_key)
+        if colony is not None:
+            colony.reset(alpha, beta, rho, Q)
+        else:
+            colony = aco_solver.AntColony(
+                graph,
+                num_ants,
+                alpha,
+                beta,
+                rho,
+                Q
+            )
+
+        # Configure threading, local search and elitist strategy in one call.
+        # Every setting is sent so nothing carries over from a reused colony
+        # (0 means auto for elitistWeight and rankSize)
+        colony.configure({
+            'useParallel': use_parallel,
+            'numThreads': num_threads,
+            'useLocalSearch': use_local_search,
+            'use3Opt': use_3opt,
+            'localSearchMode': local_search_mode,
+            'useElitist': use_elitist,
+            'elitistWeight': 0.0 if elitist_weight is None else elitist_weight,
+            'pheromoneMode': pheromone_mode,
+            'rankSize': 0 if rank_size is None else rank_size,
+        })
+
+        # Set up progress reporting: the solver thread records every iteration
+        # in a lock-free ring, and the emitter loop drains it (no Python callback)
+        start_time = time.monotonic()
+        colony.setUseProgressBuffer(True)
 
         # Configure convergence threshold if using convergence mode
         if use_convergence:
@@ -222,46 +363,174 @@ class SolverManager:
         # Solve (this releases GIL, allowing other Python threads to run)
         # Pass -1 for convergence mode, which tells C++ to run until no improvement
         max_iterations = -1 if use_convergence else iterations
-        best_tour = colony.solve(max_iterations)
-
-        # Send final result
-        elapsed = time.time() - self.start_time
-        self.is_running = False
-
-        # Get convergence data (iteration bests from C++)
-        iteration_bests = colony.getConvergenceData()
-        total_iterations = len(iteration_bests)
-
-        # Convert iteration bests to running global bests (cumulative minimum)
-        # This ensures the convergence graph always shows non-increasing values
-        global_bests = []
-        running_best = float('inf')
-        for dist in iteration_bests:
-            running_best = min(running_best, dist)
-            global_bests.append(running_best)
+        # For convergence mode, we don't know total iterations, so progress is indeterminate
+        progress_total = None if use_convergence else iterations
+        report_interval = PROGRESS_ITERATION_INTERVAL
+        if progress_total:
+            report_interval = max(report_interval, progress_total // PROGRESS_MAX_UPDATES)
+        # Warnings are sent with the first progress batch, not as separate events
+        run = _SolveRun(colony, sid, progress_total, report_interval, warnings or None)
+        self._runs[sid] = run
+        emitter = self.socketio.start_background_task(self._emit_loop, run)
+        try:
+            try:
+                best_tour = self._run_native(colony.solve, max_iterations)
+            finally:
+                # Let the emitter flush the last batch before 'complete' is sent
+                run.emitting = False
+                emitter.join()
+                if self._runs.get(sid) is run:
+                    del self._runs[sid]
+
+            # Running global bests (cumulative minimum) were already built while
+            # draining progress, so the full history is not fetched again
+            # This ensures the convergence graph always shows non-increasing values
+            if run.progress_gap:
+                # The drain fell behind and records were dropped: rebuild from C++
+                run.running_best = float('inf')
+                run.global_bests = []
+                run.append_global_bests(colony.getConvergenceData())
+            iterations_without_improvement = colony.getIterationsWithoutImprovement()
+            best_distance = best_tour.getDistance()
+        finally:
+            # Last use of the colony: once checked in, another solve may reset it
+            self._checkin_colony(colony_key, colony)
+
+        # Send final result (wall clock including setup, as shown to the user)
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+
+        global_bests = run.global_bests
+        total_iterations = len(global_bests)
 
         # Calculate optimality gap if we know the optimal distance
-        best_distance = best_tour.getDistance()
-        optimal_distance = None
         optimality_gap = None
 
-        if self.benchmark_name and self.benchmark_name in Config.BENCHMARKS:
-            optimal_distance = Config.BENCHMARKS[self.benchmark_name]['optimal']
+        if inv_optimal is not None:
             # Calculate percentage above optimal: ((solution - optimal) / optimal) * 100
-            optimality_gap = ((best_distance - optimal_distance) / optimal_distance) * 100
+            optimality_gap = (best_distance - optimal_distance) * inv_optimal * 100.0
 
         return {
             'bestDistance': best_distance,
             'bestTour': best_tour.getSequence(),
             'convergenceHistory': global_bests,
-            'cities': self.cities_coords,
-            'elapsedTime': round(elapsed, 2),
+            'elapsedMs': elapsed_ms,
             'totalIterations': total_iterations,
-            'benchmark': self.benchmark_name,
+            'iterationsWithoutImprovement': iterations_without_improvement,
+            'benchmark': benchmark_name,
             'optimalDistance': optimal_distance,
             'optimalityGap': round(optimality_gap, 2) if optimality_gap is not None else None
         }
 
-    def stop(self):
-        """Stop running solver"""
-        self.is_running = False
+    def _checkout_colony(self, colony_key):
+        """Take the idle colony if it matches colony_key (None otherwise)"""
+        with self._colony_lock:
+            if self._colony is None or self._colony_key != colony_key:
+                return None
+            colony = self._colony
+            self._colony = None
+            self._colony_key = None
+            return colony
+
+    def _checkin_colony(self, colony_key, colony):
+        """Make a finished solve's colony the idle one for the next solve"""
+        with self._colony_lock:
+            self._colony = colony
+            self._colony_key = colony_key
+
+    def _run_native(self, fn, *args):
+        """Run a GIL-releasing C++ call without blocking the event loop
+
+        Under eventlet every green thread shares one OS thread, so a long
+        colony.solve() would stall all clients; tpool runs it on a real OS
+        thread while this green thread waits cooperatively. In threading mode
+        the caller is already a dedicated background thread.
+        """
+        if self.socketio.async_mode == 'eventlet':
+            from eventlet import tpool
+            return tpool.execute(fn, *args)
+        return fn(*args)
+
+    def _emit_loop(self, run):
+        """Drain the run's progress and emit it as one batch per interval"""
+        while run.emitting:
+            self.socketio.sleep(PROGRESS_EMIT_INTERVAL)
+            self._flush_progress(run)
+        self._flush_progress(run)
+
+    def _flush_progress(self, run):
+        """Emit everything recorded since the last drain in one progress_batch event"""
+        records, best_tour = run.colony.drainProgress()
+        if best_tour is not None:
+            # Newer than any tour still waiting to be sent
+            run.best_tour = best_tour
+
+        # Keep the running global bests complete even when nothing is emitted
+        delta = []
+        if len(records):
+            iterations = records[:, 0].astype(np.int64)
+            if iterations[0] != run.last_iteration + 1:
+                run.progress_gap = True
+            run.last_iteration = int(iterations[-1])
+            delta = run.append_global_bests(records[:, 1])
+
+        if not run.is_running:
+            return
+        # Records after the last emitted update wait for the next flush
+        if run.pending_records is not None:
+            records = np.concatenate((run.pending_records, records))
+            delta = run.pending_delta + delta
+        if not len(records):
+            return
+
+        # One update per report_interval iterations. The newest record is
+        # only added on the final flush, or to carry a new tour or warnings
+        iterations = records[:, 0].astype(np.int64)
+        ends = np.flatnonzero(iterations % run.report_interval == 0).tolist()
+        last = len(records) - 1
+        if ((not ends or ends[-1] != last)
+                and (not run.emitting or run.best_tour is not None or run.warnings)):
+            ends.append(last)
+        start = ends[-1] + 1 if ends else 0
+        run.pending_records = records[start:] if start < len(records) else None
+        run.pending_delta = delta[start:]
+        if not ends:
+            return
+
+        progress_total = run.progress_total
+        best_distances = records[:, 2].tolist()
+        # Solver-side steady clock, recorded with each iteration (ms)
+        elapsed_ms = records[:, 3].astype(np.int64).tolist()
+        # Integer tenths of a percent (0-1000)
+        if progress_total:
+            progress = (iterations * 1000 // progress_total).tolist()
+
+        iterations = iterations.tolist()
+        batch = []
+        start = 0
+        for end in ends:
+            iteration = iterations[end]
+            batch.append({
+                'iteration': iteration,
+                'bestDistance': best_distances[end],
+                'convergenceDelta': delta[start:end + 1],
+                'elapsedMs': elapsed_ms[end],
+                'progressPermille': progress[end] if progress_total else 0
+            })
+            start = end + 1
+
+        # The tour is only sent when it improved since the last emit; clients
+        # keep the previous one otherwise. It rides on the newest update.
+        if run.best_tour is not None:
+            batch[-1]['bestTour'] = run.best_tour
+            run.best_tour = None
+        # Configuration warnings ride on the first update of the first batch
+        if run.warnings:
+            batch[0]['warnings'] = run.warnings
+            run.warnings = None
+        self.socketio.emit('progress_batch', batch, to=run.sid)
+
+    def stop(self, sid=None):
+        """Stop streaming progress for client sid's solve"""
+        run = self._runs.get(sid)
+        if run is not None:
+            run.is_running = False
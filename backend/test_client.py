@@ -5,128 +5,181 @@ Test client for ACO Solver Flask API
 Tests both REST endpoints and WebSocket functionality.
 Run the Flask server first: python app.py
 Then run this test: python test_client.py
+
+The Socket.IO client connects over WebSocket directly (no long-polling
+handshake first), which needs the websocket-client package.
 """
 
+import dataclasses
 import socketio
 import requests
+import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: python-socketio falls back to the json module
+    orjson = None
+from requests.adapters import HTTPAdapter
 
 # Server URL
 BASE_URL = "http://localhost:5000"
 API_URL = f"{BASE_URL}/api"
 
+# One keep-alive connection pool for all REST calls (closed by main())
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
+def _probe(path):
+    """GET one API endpoint, returning (status_code, json)"""
+    response = SESSION.get(f"{API_URL}/{path}")
+    return response.status_code, response.json()
+
+
 def test_rest_endpoints():
     """Test REST API endpoints"""
     print("=" * 60)
     print("Testing REST Endpoints")
     print("=" * 60)
 
+    # The probes are independent, so fetch them concurrently (one pooled
+    # connection each) and check the responses in order afterwards
+    paths = ['health', 'benchmarks', 'benchmarks/berlin52.tsp', 'parameters']
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        health, benchmarks, benchmark, parameters = pool.map(_probe, paths)
+
     # Test health check
     print("\n1. Testing /api/health...")
-    response = requests.get(f"{API_URL}/health")
-    print(f"   Status: {response.status_code}")
-    print(f"   Response: {response.json()}")
-    assert response.status_code == 200
-    assert response.json()['status'] == 'healthy'
+    status, data = health
+    print(f"   Status: {status}")
+    print(f"   Response: {data}")
+    assert status == 200
+    assert data['status'] == 'healthy'
     print("   ✓ Health check passed")
 
     # Test benchmarks list
     print("\n2. Testing /api/benchmarks...")
-    response = requests.get(f"{API_URL}/benchmarks")
-    print(f"   Status: {response.status_code}")
-    data = response.json()
+    status, data = benchmarks
+    print(f"   Status: {status}")
     print(f"   Found {data['count']} benchmarks")
-    assert response.status_code == 200
+    assert status == 200
     assert data['count'] > 0
     print(f"   First benchmark: {data['benchmarks'][0]['name']} ({data['benchmarks'][0]['cities']} cities)")
     print("   ✓ Benchmarks list passed")
 
     # Test specific benchmark
     print("\n3. Testing /api/benchmarks/berlin52.tsp...")
-    response = requests.get(f"{API_URL}/benchmarks/berlin52.tsp")
-    print(f"   Status: {response.status_code}")
-    data = response.json()
+    status, data = benchmark
+    print(f"   Status: {status}")
     print(f"   Benchmark: {data['name']}, Cities: {data['cities']}, Optimal: {data['optimal']}")
-    assert response.status_code == 200
+    assert status == 200
     assert data['cities'] == 52
     print("   ✓ Specific benchmark passed")
 
     # Test parameters
     print("\n4. Testing /api/parameters...")
-    response = requests.get(f"{API_URL}/parameters")
-    print(f"   Status: {response.status_code}")
-    data = response.json()
+    status, data = parameters
+    print(f"   Status: {status}")
     print(f"   Default parameters: {data['parameters']}")
-    assert response.status_code == 200
+    assert status == 200
     assert 'numAnts' in data['parameters']
     print("   ✓ Parameters passed")
 
     print("\n✓ All REST endpoint tests passed!\n")
 
 
+class _OrjsonModule:
+    """json-module shim so python-socketio decodes packets with orjson (as app.py does)"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson output is already compact, so `separators` is ignored
+        return orjson.dumps(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
+@dataclasses.dataclass(slots=True)
+class SolveEvents:
+    """What test_websocket() has received from the server so far"""
+    connected: bool = False
+    loaded: bool = False
+    progress_count: int = 0
+    complete: bool = False
+    error: Optional[str] = None
+    results: dict = dataclasses.field(default_factory=dict)
+
+
 def test_websocket():
     """Test WebSocket solve functionality"""
     print("=" * 60)
     print("Testing WebSocket Solve")
     print("=" * 60)
 
-    # Create SocketIO client
-    sio = socketio.Client()
+    # Create SocketIO client (a test run should fail, not retry). Like the
+    # polling transport, send no Origin header: this is not a browser, and
+    # the server only accepts the frontend's origins
+    sio = socketio.Client(reconnection=False,
+                          websocket_extra_options={'suppress_origin': True},
+                          json=_OrjsonModule if orjson else None)
 
     # Track events
-    events = {
-        'connected': False,
-        'loaded': False,
-        'progress_count': 0,
-        'complete': False,
-        'error': None
-    }
-
-    results = {}
+    events = SolveEvents()
+    # Set by the complete/error handlers, so the main thread wakes immediately
+    finished = threading.Event()
 
     @sio.on('connected')
     def on_connected(data):
-        events['connected'] = True
+        events.connected = True
         print(f"\n✓ Connected: {data['message']}")
 
     @sio.on('loaded')
     def on_loaded(data):
-        events['loaded'] = True
+        events.loaded = True
         print(f"✓ Loaded: {data['benchmark']} with {data['numCities']} cities")
 
-    @sio.on('progress')
-    def on_progress(data):
-        events['progress_count'] += 1
-        iteration = data['iteration']
-        best_distance = data['bestDistance']
-        progress = data['progress']
-        elapsed = data['elapsedTime']
-        print(f"  Progress: Iteration {iteration:3d} - Distance: {best_distance:8.2f} - "
-              f"Progress: {progress:5.1f}% - Elapsed: {elapsed:.2f}s")
+    @sio.on('progress_batch')
+    def on_progress_batch(batch):
+        for data in batch:
+            events.progress_count += 1
+            iteration = data['iteration']
+            best_distance = data['bestDistance']
+            progress = data['progressPermille'] / 10
+            elapsed = data['elapsedMs'] / 1000
+            print(f"  Progress: Iteration {iteration:3d} - Distance: {best_distance:8.2f} - "
+                  f"Progress: {progress:5.1f}% - Elapsed: {elapsed:.2f}s")
 
     @sio.on('complete')
     def on_complete(data):
-        events['complete'] = True
-        results.update(data)
+        events.complete = True
+        events.results = data
         print(f"\n✓ Complete!")
         print(f"  Best distance: {data['bestDistance']:.2f}")
         print(f"  Total iterations: {data['totalIterations']}")
-        print(f"  Elapsed time: {data['elapsedTime']:.2f}s")
+        print(f"  Elapsed time: {data['elapsedMs'] / 1000:.2f}s")
         print(f"  Improvement: {data['convergenceHistory'][0] - data['bestDistance']:.2f}")
+        finished.set()
 
     @sio.on('error')
     def on_error(data):
-        events['error'] = data['message']
+        events.error = data['message']
         print(f"\n✗ Error: {data['message']}")
+        finished.set()
 
     try:
         # Connect to server
         print("\nConnecting to server...")
-        sio.connect(BASE_URL)
+        # Skip the polling transport and its upgrade round trip
+        sio.connect(BASE_URL, transports=['websocket'])
         time.sleep(0.5)
 
-        assert events['connected'], "Failed to connect"
+        assert events.connected, "Failed to connect"
 
         # Send solve request
         print("\nSending solve request for berlin52.tsp (50 iterations)...")
@@ -143,19 +196,17 @@ def test_websocket():
         })
 
         # Wait for completion (max 30 seconds)
-        wait_time = 0
-        while not events['complete'] and wait_time < 30:
-            time.sleep(0.5)
-            wait_time += 0.5
+        if not finished.wait(timeout=30):
+            raise TimeoutError("Optimization did not complete within 30s")
 
         # Verify results
-        assert events['loaded'], "Graph was not loaded"
-        assert events['progress_count'] > 0, "No progress updates received"
-        assert events['complete'], "Optimization did not complete"
-        assert events['error'] is None, f"Error occurred: {events['error']}"
+        assert events.loaded, "Graph was not loaded"
+        assert events.progress_count > 0, "No progress updates received"
+        assert events.complete, "Optimization did not complete"
+        assert events.error is None, f"Error occurred: {events.error}"
 
-        print(f"\n✓ Received {events['progress_count']} progress updates")
-        print(f"✓ Final result: {results['bestDistance']:.2f} (optimal: 7542)")
+        print(f"\n✓ Received {events.progress_count} progress updates")
+        print(f"✓ Final result: {events.results['bestDistance']:.2f} (optimal: 7542)")
 
         # Disconnect
         sio.disconnect()
@@ -173,6 +224,80 @@ def test_websocket():
     return True
 
 
+def _solve_on_new_client(benchmark, params, timeout):
+    """Solve benchmark over a client of its own; return (SolveEvents, final tour)"""
+    sio = socketio.Client(reconnection=False,
+                          websocket_extra_options={'suppress_origin': True},
+                          json=_OrjsonModule if orjson else None)
+    events = SolveEvents()
+    finished = threading.Event()
+    iterations = []
+
+    @sio.on('progress_batch')
+    def on_progress_batch(batch):
+        events.progress_count += len(batch)
+        iterations.extend(data['iteration'] for data in batch)
+
+    @sio.on('complete')
+    def on_complete(data):
+        events.complete = True
+        events.results = data
+        finished.set()
+
+    @sio.on('error')
+    def on_error(data):
+        events.error = data['message']
+        finished.set()
+
+    sio.connect(BASE_URL, transports=['websocket'])
+    try:
+        sio.emit('solve', {'benchmark': benchmark, 'params': params})
+        if not finished.wait(timeout=timeout):
+            raise TimeoutError(f"Solve of {benchmark} did not complete within {timeout}s")
+    finally:
+        sio.disconnect()
+
+    # Progress must be this client's own run: iterations only ever increase
+    assert iterations == sorted(iterations), "Received another solve's progress"
+    return events, events.results.get('bestTour', [])
+
+
+def test_concurrent_solves():
+    """Test two clients solving the same benchmark with the same ant count at once"""
+    print("=" * 60)
+    print("Testing Concurrent Solves")
+    print("=" * 60)
+
+    # Same benchmark and numAnts, so both solves would share a cached colony
+    params = {'numAnts': 20, 'iterations': 300}
+    print("\nSolving a280.tsp on two clients at once (300 iterations each)...")
+
+    try:
+        # A short solve first, so the server has an idle colony to hand out
+        _solve_on_new_client('a280.tsp', {**params, 'iterations': 5}, 60)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            runs = list(pool.map(lambda _: _solve_on_new_client('a280.tsp', params, 120), range(2)))
+
+        for i, (events, tour) in enumerate(runs, 1):
+            assert events.error is None, f"Solve {i} failed: {events.error}"
+            assert events.complete, f"Solve {i} did not complete"
+            assert events.results['totalIterations'] == 300
+            assert sorted(tour) == list(range(280)), f"Solve {i} returned an invalid tour"
+            print(f"✓ Solve {i}: {events.results['bestDistance']:.2f} "
+                  f"({events.progress_count} progress updates)")
+
+        print("\n✓ Concurrent solve test passed!")
+
+    except Exception as e:
+        print(f"\n✗ Concurrent solve test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -185,10 +310,12 @@ def main():
 
     try:
         # Test REST endpoints
-        test_rest_endpoints()
+        with SESSION:
+            test_rest_endpoints()
 
         # Test WebSocket
         success = test_websocket()
+        success = test_concurrent_solves() and success
 
         if success:
             print("\n" + "=" * 60)
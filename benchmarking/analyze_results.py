@@ -6,9 +6,301 @@ Usage:
     python analyze_results.py results/benchmark_YYYYMMDD_HHMMSS.csv
 """
 
+import csv
+import math
+import os
+import statistics
 import sys
-import pandas as pd
 import argparse
+from collections import defaultdict
+
+# The only columns the analysis reads. Problem is categorical so groupby
+# hashes integer codes rather than strings; Threads is text because
+# run_benchmarks.sh writes 'auto' for the auto-detected count. The measured
+# values stay float64: float32 visibly shifts the 2-decimal report
+COLUMNS = ['Problem', 'Threads', 'Time(ms)', 'Gap(%)']
+PANDAS_TYPES = {
+    'Problem': 'category',
+    'Threads': str,
+    'Time(ms)': 'float64',
+    'Gap(%)': 'float64',
+}
+
+# Files up to this size are summarized with the csv module; pandas (and
+# pyarrow) are only imported for larger ones, since the import alone costs
+# more than parsing a typical few-hundred-row benchmark run
+SMALL_FILE_THRESHOLD = 5 * 1024 * 1024  # bytes
+
+# Files larger than this are aggregated chunk by chunk instead of loaded whole
+CHUNKED_READ_THRESHOLD = 100 * 1024 * 1024  # bytes
+CHUNK_BYTES = 16 * 1024 * 1024  # pyarrow block size when streaming
+CHUNK_ROWS = 200_000            # pandas chunk size when streaming
+
+
+def _import_readers():
+    """Import pandas and, if installed, pyarrow (returns (pd, pacsv, arrow_types))"""
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # Optional: fall back to pandas' C parser
+        return pd, None, None
+
+    arrow_types = {
+        'Problem': pa.dictionary(pa.int32(), pa.string()),
+        'Threads': pa.string(),
+        'Time(ms)': pa.float64(),
+        'Gap(%)': pa.float64(),
+    }
+    return pd, pacsv, arrow_types
+
+
+def _threads(label):
+    """Thread count for a Threads label ('auto' becomes 0)"""
+    return 0 if label == 'auto' else int(label)
+
+
+def _normalize_threads(df):
+    """Map the 'auto' thread label to 0 and make Threads an integer column"""
+    df['Threads'] = df['Threads'].replace('auto', '0').astype('int16')
+    return df
+
+
+def load_results(csv_file):
+    """Load a benchmark CSV into a DataFrame ('auto' threads become 0)"""
+    pd, pacsv, arrow_types = _import_readers()
+    if pacsv is not None:
+        df = pacsv.read_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(include_columns=COLUMNS, column_types=arrow_types),
+        ).to_pandas()
+    else:
+        df = pd.read_csv(csv_file, engine='c', low_memory=False,
+                         usecols=COLUMNS, dtype=PANDAS_TYPES)
+
+    return _normalize_threads(df)
+
+
+def iter_results(csv_file):
+    """Stream a benchmark CSV as DataFrame chunks, so memory stays bounded"""
+    pd, pacsv, arrow_types = _import_readers()
+    if pacsv is not None:
+        reader = pacsv.open_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(block_size=CHUNK_BYTES),
+            convert_options=pacsv.ConvertOptions(include_columns=COLUMNS, column_types=arrow_types),
+        )
+        for batch in reader:
+            yield _normalize_threads(batch.to_pandas())
+    else:
+        for chunk in pd.read_csv(csv_file, engine='c', chunksize=CHUNK_ROWS,
+                                 usecols=COLUMNS, dtype=PANDAS_TYPES):
+            yield _normalize_threads(chunk)
+
+
+def summarize(df):
+    """All per-(Problem, Threads) statistics the report uses, in one groupby pass
+
+    Returns a DataFrame indexed by (Problem, Threads) with time_* and gap_*
+    count/mean/std/min/max columns, sorted by problem and then thread count.
+    """
+    summary = df.groupby(['Problem', 'Threads'], observed=True).agg(
+        time_count=('Time(ms)', 'count'),
+        time_mean=('Time(ms)', 'mean'),
+        time_std=('Time(ms)', 'std'),
+        time_min=('Time(ms)', 'min'),
+        time_max=('Time(ms)', 'max'),
+        gap_count=('Gap(%)', 'count'),
+        gap_mean=('Gap(%)', 'mean'),
+        gap_std=('Gap(%)', 'std'),
+        gap_min=('Gap(%)', 'min'),
+        gap_max=('Gap(%)', 'max'),
+    )
+    # Categories only speed up the grouping; later steps need plain labels
+    problems = summary.index.levels[0].astype(object)
+    return summary.set_axis(summary.index.set_levels(problems, level='Problem')).sort_index()
+
+
+def pool_stats(stats, prefix, level):
+    """Combine the {prefix}_count/mean/std/min/max columns of rows sharing `level`
+
+    Uses the pooled-variance formula (within-group plus between-group squared
+    deviations), so the result equals aggregating the underlying rows directly.
+    """
+    import pandas as pd
+
+    count = stats[f'{prefix}_count']
+    mean = stats[f'{prefix}_mean']
+
+    total = count.groupby(level=level).transform('sum')
+    pooled_mean = (mean * count).groupby(level=level).transform('sum') / total
+    m2 = (count - 1) * stats[f'{prefix}_std'].fillna(0.0) ** 2 + count * (mean - pooled_mean) ** 2
+
+    pooled = pd.DataFrame({
+        'count': total,
+        'mean': pooled_mean,
+        'm2': m2,
+        'min': stats[f'{prefix}_min'],
+        'max': stats[f'{prefix}_max'],
+    }).groupby(level=level).agg(
+        count=('count', 'first'),
+        mean=('mean', 'first'),
+        m2=('m2', 'sum'),
+        min=('min', 'min'),
+        max=('max', 'max'),
+    )
+    pooled.insert(2, 'std', (pooled['m2'] / (pooled['count'] - 1)).where(pooled['count'] > 1) ** 0.5)
+    return pooled.drop(columns='m2')
+
+
+def gap_by_problem(summary):
+    """Per-problem Gap(%) mean/std/min/max, combined from the per-thread groups"""
+    return pool_stats(summary, 'gap', 'Problem').drop(columns='count')
+
+
+def scaling(summary):
+    """Mean time, speedup and efficiency vs serial for every (Problem, Threads) group
+
+    Speedups are computed for all groups at once by aligning each row with its
+    problem's serial (1-thread) mean time. Problems without a serial baseline
+    get NaN, as does the efficiency of auto (0) thread counts.
+    """
+    import pandas as pd
+
+    time_mean = summary['time_mean']
+    threads = summary.index.get_level_values('Threads')
+    serial = time_mean[threads == 1].droplevel('Threads')
+
+    speedup = (serial.reindex(summary.index, level='Problem') / time_mean).where(time_mean > 0, 0.0)
+    efficiency = speedup / threads.where(threads > 0) * 100
+
+    return pd.DataFrame({'time_mean': time_mean, 'speedup': speedup, 'efficiency': efficiency})
+
+
+def _column_stats(prefix, values):
+    """count/mean/std/min/max of one column's values (std is NaN below two)"""
+    if not values:
+        return {f'{prefix}_count': 0, f'{prefix}_mean': math.nan, f'{prefix}_std': math.nan,
+                f'{prefix}_min': math.nan, f'{prefix}_max': math.nan}
+    return {
+        f'{prefix}_count': len(values),
+        f'{prefix}_mean': statistics.fmean(values),
+        f'{prefix}_std': statistics.stdev(values) if len(values) > 1 else math.nan,
+        f'{prefix}_min': min(values),
+        f'{prefix}_max': max(values),
+    }
+
+
+def summarize_small(csv_file):
+    """Return (row count, summary) using only the stdlib, for small files
+
+    The summary maps (problem, threads) to the same statistics summarize()
+    computes, as {'time_count': ..., 'time_mean': ..., ...} dicts.
+    """
+    groups = defaultdict(lambda: ([], []))
+    rows = 0
+    with open(csv_file, newline='') as f:
+        for row in csv.DictReader(f):
+            rows += 1
+            times, gaps = groups[(row['Problem'], _threads(row['Threads']))]
+            # Skip blank cells, as pandas' count/mean skip NaN
+            if row['Time(ms)']:
+                times.append(float(row['Time(ms)']))
+            if row['Gap(%)']:
+                gaps.append(float(row['Gap(%)']))
+
+    return rows, {key: {**_column_stats('time', times), **_column_stats('gap', gaps)}
+                  for key, (times, gaps) in sorted(groups.items())}
+
+
+def gap_by_problem_small(summary):
+    """gap_by_problem() for a summarize_small() summary"""
+    by_problem = defaultdict(list)
+    for (problem, _), stats in summary.items():
+        by_problem[problem].append(stats)
+
+    result = {}
+    for problem, records in by_problem.items():
+        # Pooled mean and variance, as in pool_stats()
+        count = sum(r['gap_count'] for r in records)
+        if not count:
+            result[problem] = {'mean': math.nan, 'std': math.nan, 'min': math.nan, 'max': math.nan}
+            continue
+        records = [r for r in records if r['gap_count'] > 0]
+        mean = sum(r['gap_mean'] * r['gap_count'] for r in records) / count
+        m2 = sum((r['gap_count'] - 1) * (0.0 if math.isnan(r['gap_std']) else r['gap_std']) ** 2
+                 + r['gap_count'] * (r['gap_mean'] - mean) ** 2
+                 for r in records)
+        result[problem] = {
+            'mean': mean,
+            'std': math.sqrt(m2 / (count - 1)) if count > 1 else math.nan,
+            'min': min(r['gap_min'] for r in records),
+            'max': max(r['gap_max'] for r in records),
+        }
+    return result
+
+
+def scaling_small(summary):
+    """scaling() for a summarize_small() summary, as {(problem, threads): (time_mean, speedup, efficiency)}"""
+    serial = {problem: stats['time_mean'] for (problem, threads), stats in summary.items() if threads == 1}
+
+    result = {}
+    for (problem, threads), stats in summary.items():
+        time_mean = stats['time_mean']
+        speedup = serial.get(problem, math.nan) / time_mean if time_mean > 0 else 0.0
+        efficiency = speedup / threads * 100 if threads > 0 else math.nan
+        result[(problem, threads)] = (time_mean, speedup, efficiency)
+    return result
+
+
+def summarize_file(csv_file):
+    """Return (row count, speedups, quality) for a benchmark CSV
+
+    speedups maps problem -> {threads: (time_mean, speedup, efficiency)} and
+    quality maps problem -> Gap(%) {'mean', 'std', 'min', 'max'}, both sorted
+    by problem (and thread count). Small files are summarized with the stdlib;
+    larger ones with pandas, chunk by chunk above CHUNKED_READ_THRESHOLD with
+    the partial tables pooled, since every statistic the report uses can be
+    combined that way. Only the final report tables are turned into dicts.
+    """
+    size = os.path.getsize(csv_file)
+    if size <= SMALL_FILE_THRESHOLD:
+        rows, summary = summarize_small(csv_file)
+        speedup_rows = scaling_small(summary).items()
+        quality = gap_by_problem_small(summary)
+    else:
+        if size <= CHUNKED_READ_THRESHOLD:
+            df = load_results(csv_file)
+            rows, summary = len(df), summarize(df)
+        else:
+            import pandas as pd
+
+            rows = 0
+            partials = []
+            for chunk in iter_results(csv_file):
+                rows += len(chunk)
+                partials.append(summarize(chunk))
+
+            partials = pd.concat(partials)
+            groups = ['Problem', 'Threads']
+            summary = pool_stats(partials, 'time', groups).add_prefix('time_').join(
+                pool_stats(partials, 'gap', groups).add_prefix('gap_'))
+
+        table = scaling(summary)
+        speedup_rows = zip(table.index, table.itertuples(index=False, name=None))
+        quality = gap_by_problem(summary).to_dict('index')
+
+    speedups = defaultdict(dict)
+    for (problem, threads), values in speedup_rows:
+        speedups[problem][int(threads)] = values
+    return rows, speedups, quality
+
+
+def _mean_std(values):
+    """Mean and sample standard deviation (NaN below two values)"""
+    return statistics.fmean(values), statistics.stdev(values) if len(values) > 1 else math.nan
 
 
 def analyze_benchmark(csv_file):
@@ -19,33 +311,24 @@ def analyze_benchmark(csv_file):
     print("=" * 80)
     print()
 
-    # Load data
-    df = pd.read_csv(csv_file)
-    print(f"Loaded {len(df)} benchmark results from: {csv_file}")
+    # Load data and summarize by problem and threads (the only pass over the raw rows)
+    rows, speedups, quality = summarize_file(csv_file)
+    print(f"Loaded {rows} benchmark results from: {csv_file}")
     print()
 
-    # Summary by problem and threads
-    summary = df.groupby(['Problem', 'Threads']).agg({
-        'Time(ms)': ['mean', 'std', 'min', 'max'],
-        'BestDistance': ['mean', 'std'],
-        'Gap(%)': ['mean', 'std']
-    }).round(2)
-
     # Calculate speedups
     print("-" * 80)
     print("SPEEDUP ANALYSIS (vs Serial)")
     print("-" * 80)
     print()
 
-    for problem in df['Problem'].unique():
-        problem_data = summary.loc[problem]
-
+    for problem, problem_data in speedups.items():
         # Get serial time
-        if 1 not in problem_data.index:
+        if 1 not in problem_data:
             print(f"⚠️  {problem}: No serial baseline found")
             continue
 
-        serial_time = problem_data.loc[1, ('Time(ms)', 'mean')]
+        serial_time = problem_data[1][0]
 
         print(f"{problem}")
         print(f"  Serial baseline: {serial_time:.2f}ms")
@@ -53,11 +336,9 @@ def analyze_benchmark(csv_file):
         print(f"  {'Threads':>10} {'Avg Time (ms)':>15} {'Speedup':>10} {'Efficiency':>12}")
         print(f"  {'-'*10} {'-'*15} {'-'*10} {'-'*12}")
 
-        for threads in sorted(problem_data.index):
-            avg_time = problem_data.loc[threads, ('Time(ms)', 'mean')]
-            speedup = serial_time / avg_time if avg_time > 0 else 0
-            efficiency = (speedup / threads * 100) if threads > 0 else 100
-
+        for threads, (avg_time, speedup, efficiency) in problem_data.items():
+            if math.isnan(efficiency):
+                efficiency = 100.0
             threads_label = "auto" if threads == 0 else str(threads)
 
             print(f"  {threads_label:>10} {avg_time:>15.2f} {speedup:>9.2f}× {efficiency:>11.1f}%")
@@ -70,18 +351,14 @@ def analyze_benchmark(csv_file):
     print("-" * 80)
     print()
 
-    quality = df.groupby('Problem').agg({
-        'Gap(%)': ['mean', 'std', 'min', 'max']
-    }).round(2)
-
     print(f"{'Problem':20} {'Avg Gap':>10} {'Std Dev':>10} {'Min Gap':>10} {'Max Gap':>10}")
     print(f"{'-'*20} {'-'*10} {'-'*10} {'-'*10} {'-'*10}")
 
-    for problem in quality.index:
-        avg_gap = quality.loc[problem, ('Gap(%)', 'mean')]
-        std_gap = quality.loc[problem, ('Gap(%)', 'std')]
-        min_gap = quality.loc[problem, ('Gap(%)', 'min')]
-        max_gap = quality.loc[problem, ('Gap(%)', 'max')]
+    for problem, gap in quality.items():
+        avg_gap = round(gap['mean'], 2)
+        std_gap = round(gap['std'], 2)
+        min_gap = round(gap['min'], 2)
+        max_gap = round(gap['max'], 2)
 
         print(f"{problem:20} {avg_gap:>9.2f}% {std_gap:>9.2f}% {min_gap:>9.2f}% {max_gap:>9.2f}%")
 
@@ -93,37 +370,21 @@ def analyze_benchmark(csv_file):
     print("-" * 80)
     print()
 
-    # Calculate average speedup for each thread count
-    speedups = []
-    for problem in df['Problem'].unique():
-        problem_df = df[df['Problem'] == problem]
-        problem_summary = problem_df.groupby('Threads')['Time(ms)'].mean()
-
-        if 1 in problem_summary.index:
-            serial_time = problem_summary[1]
-            for threads in problem_summary.index:
-                if threads != 1:
-                    speedup = serial_time / problem_summary[threads]
-                    speedups.append({
-                        'threads': threads,
-                        'speedup': speedup,
-                        'efficiency': (speedup / threads * 100) if threads > 0 else 0
-                    })
-
-    if speedups:
-        speedup_df = pd.DataFrame(speedups)
-        thread_stats = speedup_df.groupby('threads').agg({
-            'speedup': ['mean', 'std'],
-            'efficiency': 'mean'
-        }).round(2)
+    # Average speedup for each parallel thread count, over problems with a serial baseline
+    by_threads = defaultdict(list)
+    for problem_data in speedups.values():
+        for threads, (_, speedup, efficiency) in problem_data.items():
+            if threads != 1 and not math.isnan(speedup):
+                by_threads[threads].append((speedup, 0.0 if math.isnan(efficiency) else efficiency))
 
+    if by_threads:
         print(f"{'Threads':>10} {'Avg Speedup':>12} {'Std Dev':>10} {'Efficiency':>12}")
         print(f"{'-'*10} {'-'*12} {'-'*10} {'-'*12}")
 
-        for threads in sorted(thread_stats.index):
-            avg_speedup = thread_stats.loc[threads, ('speedup', 'mean')]
-            std_speedup = thread_stats.loc[threads, ('speedup', 'std')]
-            efficiency = thread_stats.loc[threads, ('efficiency', 'mean')]
+        for threads in sorted(by_threads):
+            speedups_, efficiencies = zip(*by_threads[threads])
+            avg_speedup, std_speedup = (round(v, 2) for v in _mean_std(speedups_))
+            efficiency = round(statistics.fmean(efficiencies), 2)
 
             threads_label = "auto" if threads == 0 else str(threads)
 
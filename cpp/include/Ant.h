@@ -47,7 +47,7 @@ private:
     double tourLength_;
     int numCities_;
 
-    // Shared random number generator for all ants
+    // Per-thread random number generator for all ants
     static std::mt19937& getRandomGenerator();
 };
 
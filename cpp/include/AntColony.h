@@ -3,12 +3,15 @@
 
 #include <vector>
 #include <random>
+#include <chrono>
 #include <functional>
+#include <memory>
 #include "Graph.h"
 #include "PheromoneMatrix.h"
 #include "Ant.h"
 #include "Tour.h"
 #include "LocalSearch.h"
+#include "ProgressBuffer.h"
 
 class AntColony {
 public:
@@ -22,6 +25,10 @@ public:
     // Initialize pheromones and ants
     void initialize();
 
+    // Change the ACO parameters and re-initialize for another run, keeping the
+    // graph copy, settings and buffers (cheaper than constructing a new colony)
+    void reset(double alpha, double beta, double rho, double Q);
+
     // Execute one complete iteration
     void runIteration();
 
@@ -44,6 +51,14 @@ public:
     // Set convergence threshold (default: 200 iterations without improvement)
     void setConvergenceThreshold(int threshold);
 
+    // Enable/disable the lock-free progress buffer (default: disabled)
+    // When enabled, solve() records every iteration and each improved tour
+    // without calling back, for a consumer draining it from another thread
+    void setUseProgressBuffer(bool enabled);
+
+    // Get progress buffer (nullptr if disabled)
+    ProgressBuffer* getProgressBuffer() const { return progressBuffer_.get(); }
+
     // Enable/disable parallel execution (default: true if OpenMP available)
     void setUseParallel(bool useParallel);
 
@@ -84,12 +99,19 @@ public:
     // Get iteration history
     const std::vector<double>& getConvergenceData() const { return iterationBestDistances_; }
 
+    // Get milliseconds spent in the last solve() (monotonic steady clock)
+    double getElapsedMs() const { return elapsedMs_; }
+
+    // Get number of consecutive iterations without improvement at the end of the last solve()
+    int getIterationsWithoutImprovement() const { return iterationsWithoutImprovement_; }
+
     // Getters for parameters
     int getNumAnts() const { return numAnts_; }
     double getAlpha() const { return alpha_; }
     double getBeta() const { return beta_; }
     double getRho() const { return rho_; }
     double getQ() const { return Q_; }
+    double getInitialPheromone() const { return initialPheromone_; }
 
 private:
     Graph graph_;
@@ -100,12 +122,17 @@ private:
     double beta_;        // Heuristic importance
     double rho_;         // Evaporation rate
     double Q_;           // Pheromone deposit factor
+    double initialPheromone_ = 1.0;  // τ₀ = m / C^nn (1.0 if there is no tour)
     bool useDistinctStartCities_;  // If true, each ant starts at different city
     Tour bestTour_;
     std::vector<double> iterationBestDistances_;
     ProgressCallback progressCallback_;  // Callback for progress updates
     int callbackInterval_ = 10;          // Invoke callback every N iterations
     int convergenceThreshold_ = 200;     // Iterations without improvement before stopping
+    int iterationsWithoutImprovement_ = 0;  // Consecutive iterations since the best tour improved
+    std::chrono::steady_clock::time_point solveStart_;  // When the current solve() started
+    double elapsedMs_ = 0.0;             // Duration of the last solve()
+    std::shared_ptr<ProgressBuffer> progressBuffer_;  // Lock-free progress channel (optional)
 
     // Threading control
     bool useParallel_ = true;            // Enable parallel execution (if OpenMP available)
@@ -125,7 +152,16 @@ private:
     // Store constructed/improved tours for pheromone updates
     std::vector<Tour> antTours_;         // Tours from each ant (possibly improved by local search)
 
-    // Shared random number generator for colony
+    // Update iterationsWithoutImprovement_ after an iteration
+    void trackImprovement(double currentBestDistance, double& lastBestDistance);
+
+    // Milliseconds since solveStart_
+    double millisecondsSinceStart() const;
+
+    // Push the latest iteration (and best tour, if improved) to progressBuffer_
+    void recordProgress(int iteration, double& publishedBest);
+
+    // Per-thread random number generator for colony
     static std::mt19937& getRandomGenerator();
 };
 
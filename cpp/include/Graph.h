@@ -10,8 +10,16 @@
 #define GRAPH_H
 
 #include "City.h"
+#include <cstdint>
+#include <string>
 #include <vector>
 
+#ifdef ACO_QUANTIZED_DISTANCES
+#ifndef ACO_DISTANCE_SCALE
+#define ACO_DISTANCE_SCALE 1000  ///< Fixed-point steps per distance unit
+#endif
+#endif
+
 /**
  * @class Graph
  * @brief Complete representation of the TSP problem with cities and distances
@@ -70,6 +78,27 @@ public:
      */
     const std::vector<City>& getCities() const;
 
+    /**
+     * @brief Get all city coordinates as one contiguous planar array
+     * @return const std::vector<double>& [x0 .. x(n-1), y0 .. y(n-1)]
+     *
+     * Lets bindings expose the coordinates without copying (e.g. as an
+     * n×2 NumPy view with strides (8, 8n)).
+     */
+    const std::vector<double>& getCoordinates() const;
+
+    /**
+     * @brief Get the x coordinates of all cities
+     * @return const double* Pointer to n contiguous x values (city order)
+     */
+    const double* getXs() const;
+
+    /**
+     * @brief Get the y coordinates of all cities
+     * @return const double* Pointer to n contiguous y values (city order)
+     */
+    const double* getYs() const;
+
     /**
      * @brief Check if the graph contains cities
      * @return true if graph has at least one city, false otherwise
@@ -87,19 +116,83 @@ public:
      */
     double nearestNeighborTourLength(int startCity = 0) const;
 
+#ifdef ACO_QUANTIZED_DISTANCES
+    /**
+     * @brief Get the fixed-point distance between two cities
+     * @param cityA Index of first city (0-based)
+     * @param cityB Index of second city (0-based)
+     * @return std::int32_t round(distance × getDistanceScale())
+     *
+     * Half the bytes of getDistance() per lookup, for the bandwidth-bound
+     * local search scans. Note: No bounds checking - caller must ensure
+     * valid indices
+     */
+    std::int32_t getScaledDistance(int cityA, int cityB) const {
+        return scaledDistances_[static_cast<size_t>(cityA) * numCities_ + cityB];
+    }
+
+    /**
+     * @brief Get the fixed-point scale of getScaledDistance()
+     * @return double ACO_DISTANCE_SCALE, or less if the longest distance
+     *         would not fit in an int32 at that scale
+     */
+    double getDistanceScale() const;
+#endif
+
+    /**
+     * @brief Write the cities and distance matrix to a binary cache file
+     * @param filename Path of the cache file to (over)write
+     * @return true on success, false if the file could not be written
+     *
+     * The file holds the raw native-endian values, so it is only meant to be
+     * read back by Graph::load() on the same platform.
+     */
+    bool save(const std::string& filename) const;
+
+    /**
+     * @brief Load a graph written by save()
+     * @param filename Path to the cache file
+     * @return Graph with the stored cities and distances, or empty Graph on error
+     *
+     * Reads the distance matrix as stored instead of recomputing it, which
+     * skips both the text parsing and the O(n²) matrix build.
+     */
+    static Graph load(const std::string& filename);
+
 private:
     std::vector<City> cities_;                          ///< All cities in the problem
+    std::vector<double> coordinates_;                   ///< Planar coordinates: all x, then all y
     std::vector<std::vector<double>> distanceMatrix_;   ///< Precomputed n×n distance matrix
     int numCities_;                                     ///< Number of cities (cached for efficiency)
+#ifdef ACO_QUANTIZED_DISTANCES
+    std::vector<std::int32_t> scaledDistances_;         ///< Fixed-point n×n matrix (row-major)
+    double distanceScale_ = ACO_DISTANCE_SCALE;         ///< Fixed-point steps per distance unit
+#endif
+
+    /**
+     * @brief Fill the planar coordinate array from cities_
+     */
+    void buildCoordinates();
 
     /**
      * @brief Build the symmetric distance matrix
      *
-     * Computes distances between all pairs of cities. Since the matrix is
-     * symmetric, only the upper triangle is computed and then mirrored.
+     * Computes distances between all pairs of cities from the planar
+     * coordinate arrays. Since the matrix is symmetric, only the upper
+     * triangle is computed and then mirrored.
      * Time complexity: O(n²) where n is the number of cities
      */
     void buildDistanceMatrix();
+
+#ifdef ACO_QUANTIZED_DISTANCES
+    /**
+     * @brief Build the fixed-point copy of the distance matrix
+     *
+     * Lowers the scale below ACO_DISTANCE_SCALE if needed, so that the
+     * longest distance still fits in an int32.
+     */
+    void buildScaledDistances();
+#endif
 };
 
 #endif // GRAPH_H
@@ -13,6 +13,7 @@
 
 #include "Tour.h"
 #include "Graph.h"
+#include <cstdint>
 
 /**
  * @class LocalSearch
@@ -70,6 +71,44 @@ public:
     static bool improve(Tour& tour, const Graph& graph, bool use3opt = true);
 
 private:
+#ifdef ACO_QUANTIZED_DISTANCES
+    /// Edge length sums in fixed point (Graph::getScaledDistance)
+    using Length = std::int64_t;
+
+    /**
+     * @brief How far below zero a delta must be to surely shorten the tour
+     *
+     * A move replacing k edges sums 2k scaled lengths (k removed, k added),
+     * each rounded by at most half a unit, so rounding alone can lower its
+     * delta by up to k units. Requiring delta < -k means every applied move
+     * is a real improvement: k = 2 for 2-opt, 3 for 3-opt's three-edge cases.
+     */
+    static constexpr Length improvementEpsilon(int changedEdges) {
+        return changedEdges;
+    }
+#else
+    /// Edge length sums in double, compared with a small tolerance
+    using Length = double;
+
+    /**
+     * @brief Tolerance for floating point deltas (the same for every move)
+     */
+    static constexpr Length improvementEpsilon(int /*changedEdges*/) {
+        return 1e-9;
+    }
+#endif
+
+    /**
+     * @brief Length of edge (cityA, cityB) in the units local search compares
+     */
+    static Length edgeLength(const Graph& graph, int cityA, int cityB) {
+#ifdef ACO_QUANTIZED_DISTANCES
+        return graph.getScaledDistance(cityA, cityB);
+#else
+        return graph.getDistance(cityA, cityB);
+#endif
+    }
+
     /**
      * @brief Calculate the change in tour distance from a 2-opt swap
      * @param sequence Current tour sequence
@@ -80,7 +119,7 @@ private:
      *
      * Computes delta = new_distance - old_distance without reconstructing tour
      */
-    static double calculate2OptDelta(const std::vector<int>& sequence,
+    static Length calculate2OptDelta(const std::vector<int>& sequence,
                                      const Graph& graph, int i, int j);
 
     /**
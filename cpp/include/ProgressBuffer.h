@@ -0,0 +1,60 @@
+#ifndef PROGRESSBUFFER_H
+#define PROGRESSBUFFER_H
+
+#include <atomic>
+#include <cstddef>
+#include <vector>
+
+// One entry per solver iteration
+struct ProgressRecord {
+    int iteration;           // 1-based iteration number
+    double iterationBest;    // Best distance found in this iteration
+    double bestDistance;     // Best distance found so far
+    double elapsedMs;        // Milliseconds since solve() started (steady clock)
+};
+
+// Lock-free single-producer/single-consumer progress channel.
+// The solver thread pushes records and publishes improved tours without
+// blocking; one consumer thread drains them at its own pace.
+class ProgressBuffer {
+public:
+    // Constructor (capacity is rounded up to a power of two)
+    explicit ProgressBuffer(std::size_t capacity = 16384);
+
+    // Producer: append a record; returns false (and counts a drop) if full
+    bool push(const ProgressRecord& record);
+
+    // Producer: publish the latest best tour (overwrites any unread one)
+    void publishTour(const std::vector<int>& tour);
+
+    // Consumer: append all pending records to out, returns how many were added
+    std::size_t drain(std::vector<ProgressRecord>& out);
+
+    // Consumer: copy the latest published tour into out if it is new
+    bool takeTour(std::vector<int>& out);
+
+    // Discard pending records and tours (only while no thread is using the buffer)
+    void clear();
+
+    // Getters
+    std::size_t getCapacity() const { return records_.size(); }
+    std::size_t getDroppedCount() const { return dropped_.load(std::memory_order_relaxed); }
+
+private:
+    static constexpr int kDirty = 4;  // Set on tourMiddle_ when it holds an unread tour
+
+    std::vector<ProgressRecord> records_;
+    std::size_t mask_;
+    alignas(64) std::atomic<std::size_t> head_{0};  // Next slot to write (producer)
+    alignas(64) std::atomic<std::size_t> tail_{0};  // Next slot to read (consumer)
+    std::atomic<std::size_t> dropped_{0};
+
+    // Triple buffer for the best tour: producer owns tourBack_, consumer owns
+    // tourFront_, and the two swap through tourMiddle_
+    std::vector<int> tours_[3];
+    int tourBack_ = 0;
+    int tourFront_ = 1;
+    alignas(64) std::atomic<int> tourMiddle_{2};
+};
+
+#endif // PROGRESSBUFFER_H
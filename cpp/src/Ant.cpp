@@ -4,10 +4,10 @@
 #include <algorithm>
 #include <stdexcept>
 
-// Shared random number generator for all Ant instances
+// Per-thread random number generator for all Ant instances, so OpenMP workers and
+// colonies solved from different Python threads never share engine state
 std::mt19937& Ant::getRandomGenerator() {
-    static std::random_device rd;
-    static std::mt19937 gen(rd());
+    thread_local std::mt19937 gen(std::random_device{}());
     return gen;
 }
 
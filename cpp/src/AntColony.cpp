@@ -7,10 +7,10 @@
 #include <omp.h>
 #endif
 
-// Shared random number generator for AntColony
+// Per-thread random number generator for AntColony, so OpenMP workers and
+// colonies solved from different Python threads never share engine state
 std::mt19937& AntColony::getRandomGenerator() {
-    static std::random_device rd;
-    static std::mt19937 gen(rd());
+    thread_local std::mt19937 gen(std::random_device{}());
     return gen;
 }
 
@@ -27,20 +27,19 @@ AntColony::AntColony(const Graph& graph, int numAnts, double alpha, double beta,
       bestTour_(std::vector<int>(), std::numeric_limits<double>::max()) {
     // Create ants
     ants_.reserve(numAnts);
-}
 
-void AntColony::initialize() {
     // Calculate initial pheromone value using τ₀ = m / C^nn
-    // where m is the number of ants and C^nn is the nearest neighbor tour length
+    // where m is the number of ants and C^nn is the nearest neighbor tour length.
+    // Both are fixed for this colony, so the O(n²) tour is built only once
     double nearestNeighborLength = graph_.nearestNeighborTourLength();
-    double initialPheromone = 1.0;  // Default fallback
-
     if (nearestNeighborLength > 0.0) {
-        initialPheromone = static_cast<double>(numAnts_) / nearestNeighborLength;
+        initialPheromone_ = static_cast<double>(numAnts_) / nearestNeighborLength;
     }
+}
 
-    // Initialize pheromone matrix with calculated value
-    pheromones_.initialize(initialPheromone);
+void AntColony::initialize() {
+    // Initialize pheromone matrix with the precomputed τ₀
+    pheromones_.initialize(initialPheromone_);
 
     // Clear iteration history
     iterationBestDistances_.clear();
@@ -49,6 +48,20 @@ void AntColony::initialize() {
     bestTour_ = Tour(std::vector<int>(), std::numeric_limits<double>::max());
 }
 
+void AntColony::reset(double alpha, double beta, double rho, double Q) {
+    alpha_ = alpha;
+    beta_ = beta;
+    rho_ = rho;
+    Q_ = Q;
+
+    // Drop anything a consumer has not drained from the previous run
+    if (progressBuffer_) {
+        progressBuffer_->clear();
+    }
+
+    initialize();
+}
+
 void AntColony::constructSolutions() {
     int numCities = graph_.getNumCities();
 
@@ -310,28 +323,28 @@ void AntColony::runIteration() {
 }
 
 Tour AntColony::solve(int maxIterations, ProgressCallback callback) {
+    solveStart_ = std::chrono::steady_clock::now();
     initialize();
+    double publishedBest = std::numeric_limits<double>::max();  // Last tour sent to progressBuffer_
+
+    iterationsWithoutImprovement_ = 0;
+    double lastBestDistance = std::numeric_limits<double>::max();
 
     if (maxIterations < 0) {
         // Run until no improvement for convergenceThreshold_ iterations
-        int iterationsWithoutImprovement = 0;
         int iteration = 0;
-        double lastBestDistance = std::numeric_limits<double>::max();
 
-        while (iterationsWithoutImprovement < convergenceThreshold_) {
+        while (iterationsWithoutImprovement_ < convergenceThreshold_) {
             runIteration();
             iteration++;
 
-            double currentBestDistance = bestTour_.getDistance();
-
-            // Check if we found a better solution
-            if (currentBestDistance < lastBestDistance) {
-                iterationsWithoutImprovement = 0;
-                lastBestDistance = currentBestDistance;
-            } else {
-                iterationsWithoutImprovement++;
+            if (progressBuffer_) {
+                recordProgress(iteration, publishedBest);
             }
 
+            double currentBestDistance = bestTour_.getDistance();
+            trackImprovement(currentBestDistance, lastBestDistance);
+
             // Call progress callback if provided and at the right interval
             ProgressCallback activeCallback = callback ? callback : progressCallback_;
             if (activeCallback && (iteration % callbackInterval_ == 0)) {
@@ -344,8 +357,13 @@ Tour AntColony::solve(int maxIterations, ProgressCallback callback) {
         for (int i = 0; i < maxIterations; ++i) {
             runIteration();
 
-            // Call progress callback if provided and at the right interval
             int iteration = i + 1;
+            if (progressBuffer_) {
+                recordProgress(iteration, publishedBest);
+            }
+            trackImprovement(bestTour_.getDistance(), lastBestDistance);
+
+            // Call progress callback if provided and at the right interval
             ProgressCallback activeCallback = callback ? callback : progressCallback_;
             if (activeCallback && (iteration % callbackInterval_ == 0)) {
                 activeCallback(iteration, bestTour_.getDistance(),
@@ -354,9 +372,47 @@ Tour AntColony::solve(int maxIterations, ProgressCallback callback) {
         }
     }
 
+    elapsedMs_ = millisecondsSinceStart();
     return bestTour_;
 }
 
+void AntColony::trackImprovement(double currentBestDistance, double& lastBestDistance) {
+    // Check if we found a better solution
+    if (currentBestDistance < lastBestDistance) {
+        iterationsWithoutImprovement_ = 0;
+        lastBestDistance = currentBestDistance;
+    } else {
+        iterationsWithoutImprovement_++;
+    }
+}
+
+double AntColony::millisecondsSinceStart() const {
+    return std::chrono::duration<double, std::milli>(
+        std::chrono::steady_clock::now() - solveStart_).count();
+}
+
+void AntColony::recordProgress(int iteration, double& publishedBest) {
+    double bestDistance = bestTour_.getDistance();
+
+    // Publish the tour before the record, so a consumer that sees the new
+    // best distance can also pick up the matching tour
+    if (bestDistance < publishedBest) {
+        progressBuffer_->publishTour(bestTour_.getSequence());
+        publishedBest = bestDistance;
+    }
+
+    progressBuffer_->push({iteration, iterationBestDistances_.back(), bestDistance,
+                          millisecondsSinceStart()});
+}
+
+void AntColony::setUseProgressBuffer(bool enabled) {
+    if (enabled && !progressBuffer_) {
+        progressBuffer_ = std::make_shared<ProgressBuffer>();
+    } else if (!enabled) {
+        progressBuffer_.reset();
+    }
+}
+
 void AntColony::setProgressCallback(ProgressCallback callback) {
     progressCallback_ = callback;
 }
@@ -376,9 +432,9 @@ void AntColony::setUseParallel(bool useParallel) {
 void AntColony::setNumThreads(int numThreads) {
     numThreads_ = numThreads;
 #ifdef _OPENMP
-    if (numThreads > 0) {
-        omp_set_num_threads(numThreads);
-    }
+    // 0 restores auto, so a reused colony does not keep an earlier count.
+    // omp_get_num_procs() only counts CPUs in this process's affinity mask
+    omp_set_num_threads(numThreads > 0 ? numThreads : omp_get_num_procs());
 #endif
 }
 
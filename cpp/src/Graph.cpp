@@ -4,6 +4,12 @@
  */
 
 #include "Graph.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <iostream>
 #include <limits>
 
 /**
@@ -12,6 +18,7 @@
  */
 Graph::Graph(const std::vector<City>& cities)
     : cities_(cities), numCities_(cities.size()) {
+    buildCoordinates();
     buildDistanceMatrix();
 }
 
@@ -21,6 +28,19 @@ Graph::Graph(const std::vector<City>& cities)
  */
 Graph::Graph() : numCities_(0) {}
 
+/**
+ * Planar (structure-of-arrays) copy of the coordinates: [xs | ys].
+ * Coordinate-only passes read them as unit-stride arrays instead of
+ * striding through City objects.
+ */
+void Graph::buildCoordinates() {
+    coordinates_.resize(2 * cities_.size());
+    for (int i = 0; i < numCities_; ++i) {
+        coordinates_[i] = cities_[i].getX();
+        coordinates_[numCities_ + i] = cities_[i].getY();
+    }
+}
+
 /**
  * Build the distance matrix by computing Euclidean distances between
  * all pairs of cities. This is done once at construction to enable
@@ -37,19 +57,70 @@ void Graph::buildDistanceMatrix() {
     // Allocate n×n matrix initialized with zeros
     distanceMatrix_.resize(numCities_, std::vector<double>(numCities_, 0.0));
 
+    const double* xs = getXs();
+    const double* ys = getYs();
+
     // Calculate distances between all pairs of cities
     // Note: diagonal (i==i) remains 0.0 (distance from city to itself)
     for (int i = 0; i < numCities_; ++i) {
+        const double xi = xs[i];
+        const double yi = ys[i];
+        double* row = distanceMatrix_[i].data();
+
+        // Unit-stride loop over the planar arrays (same formula as
+        // City::distanceTo(), so results are bit-identical)
         for (int j = i + 1; j < numCities_; ++j) {
-            // Compute distance once using City::distanceTo()
-            double distance = cities_[i].distanceTo(cities_[j]);
-            // Store in both positions for symmetric matrix
-            distanceMatrix_[i][j] = distance;
-            distanceMatrix_[j][i] = distance;
+            double dx = xi - xs[j];
+            double dy = yi - ys[j];
+            row[j] = std::sqrt(dx * dx + dy * dy);
+        }
+
+        // Mirror the row into the lower triangle
+        for (int j = i + 1; j < numCities_; ++j) {
+            distanceMatrix_[j][i] = row[j];
+        }
+    }
+
+#ifdef ACO_QUANTIZED_DISTANCES
+    buildScaledDistances();
+#endif
+}
+
+#ifdef ACO_QUANTIZED_DISTANCES
+/**
+ * Quantize the distance matrix into a flat row-major int32 array.
+ * Local search only compares sums of edge lengths, so fixed-point values
+ * at 1/scale resolution give the same moves up to that resolution.
+ */
+void Graph::buildScaledDistances() {
+    double maxDistance = 0.0;
+    for (const std::vector<double>& row : distanceMatrix_) {
+        for (double distance : row) {
+            maxDistance = std::max(maxDistance, distance);
+        }
+    }
+
+    distanceScale_ = ACO_DISTANCE_SCALE;
+    const double limit = static_cast<double>(std::numeric_limits<std::int32_t>::max());
+    if (maxDistance * distanceScale_ > limit) {
+        distanceScale_ = std::floor(limit / maxDistance);
+    }
+
+    scaledDistances_.resize(static_cast<size_t>(numCities_) * numCities_);
+    for (int i = 0; i < numCities_; ++i) {
+        std::int32_t* scaledRow = scaledDistances_.data() + static_cast<size_t>(i) * numCities_;
+        for (int j = 0; j < numCities_; ++j) {
+            scaledRow[j] = static_cast<std::int32_t>(std::llround(distanceMatrix_[i][j] * distanceScale_));
         }
     }
 }
 
+// Return the fixed-point scale of the quantized matrix
+double Graph::getDistanceScale() const {
+    return distanceScale_;
+}
+#endif
+
 /**
  * Get the precomputed distance between two cities.
  * Includes bounds checking to prevent invalid memory access.
@@ -79,6 +150,21 @@ const std::vector<City>& Graph::getCities() const {
     return cities_;
 }
 
+// Return reference to planar coordinate array
+const std::vector<double>& Graph::getCoordinates() const {
+    return coordinates_;
+}
+
+// Return pointer to the x half of the planar array
+const double* Graph::getXs() const {
+    return coordinates_.data();
+}
+
+// Return pointer to the y half of the planar array
+const double* Graph::getYs() const {
+    return coordinates_.data() + numCities_;
+}
+
 // Check if graph is valid (contains at least one city)
 bool Graph::isValid() const {
     return numCities_ > 0;
@@ -139,3 +225,118 @@ double Graph::nearestNeighborTourLength(int startCity) const {
 
     return totalLength;
 }
+
+// Cache file layout (native endianness):
+//   char[4] magic "ACOG", uint32 version, uint32 numCities,
+//   numCities × (int32 id, double x, double y), numCities² doubles (row-major)
+namespace {
+constexpr char kCacheMagic[4] = {'A', 'C', 'O', 'G'};
+constexpr std::uint32_t kCacheVersion = 1;
+}
+
+/**
+ * Write the graph to a binary cache file.
+ *
+ * @return true if every byte was written, false otherwise
+ */
+bool Graph::save(const std::string& filename) const {
+    std::ofstream file(filename, std::ios::binary | std::ios::trunc);
+    if (!file.is_open()) {
+        std::cerr << "Error: Cannot write graph cache: " << filename << std::endl;
+        return false;
+    }
+
+    const std::uint32_t n = static_cast<std::uint32_t>(numCities_);
+    file.write(kCacheMagic, sizeof(kCacheMagic));
+    file.write(reinterpret_cast<const char*>(&kCacheVersion), sizeof(kCacheVersion));
+    file.write(reinterpret_cast<const char*>(&n), sizeof(n));
+
+    for (const City& city : cities_) {
+        const std::int32_t id = city.getId();
+        const double x = city.getX();
+        const double y = city.getY();
+        file.write(reinterpret_cast<const char*>(&id), sizeof(id));
+        file.write(reinterpret_cast<const char*>(&x), sizeof(x));
+        file.write(reinterpret_cast<const char*>(&y), sizeof(y));
+    }
+
+    for (const std::vector<double>& row : distanceMatrix_) {
+        file.write(reinterpret_cast<const char*>(row.data()),
+                   static_cast<std::streamsize>(row.size() * sizeof(double)));
+    }
+
+    return static_cast<bool>(file);
+}
+
+/**
+ * Load a graph from a cache file written by save().
+ * The distance rows are read straight into the matrix, so no distance is
+ * recomputed.
+ *
+ * @return Graph on success, empty Graph if the file is missing or malformed
+ */
+Graph Graph::load(const std::string& filename) {
+    std::ifstream file(filename, std::ios::binary | std::ios::ate);
+    if (!file.is_open()) {
+        std::cerr << "Error: Cannot open graph cache: " << filename << std::endl;
+        return Graph();
+    }
+    const std::uint64_t fileSize = static_cast<std::uint64_t>(file.tellg());
+    file.seekg(0);
+
+    char magic[sizeof(kCacheMagic)];
+    std::uint32_t version = 0;
+    std::uint32_t n = 0;
+    file.read(magic, sizeof(magic));
+    file.read(reinterpret_cast<char*>(&version), sizeof(version));
+    file.read(reinterpret_cast<char*>(&n), sizeof(n));
+    if (!file || std::memcmp(magic, kCacheMagic, sizeof(magic)) != 0 || version != kCacheVersion) {
+        std::cerr << "Error: Not a graph cache file: " << filename << std::endl;
+        return Graph();
+    }
+
+    // Check the header's city count against the file size before allocating
+    // anything, so a corrupt count cannot request a huge allocation. Once
+    // n <= fileSize / 8, n² × 8 cannot overflow
+    const std::uint64_t headerBytes = sizeof(kCacheMagic) + sizeof(version) + sizeof(n);
+    const std::uint64_t cityBytes = sizeof(std::int32_t) + 2 * sizeof(double);
+    if (n > fileSize / sizeof(double) ||
+        fileSize != headerBytes + n * cityBytes + static_cast<std::uint64_t>(n) * n * sizeof(double)) {
+        std::cerr << "Error: Truncated graph cache file: " << filename << std::endl;
+        return Graph();
+    }
+
+    Graph graph;
+    graph.numCities_ = static_cast<int>(n);
+    graph.cities_.reserve(n);
+    for (std::uint32_t i = 0; i < n && file; ++i) {
+        std::int32_t id = 0;
+        double x = 0.0;
+        double y = 0.0;
+        file.read(reinterpret_cast<char*>(&id), sizeof(id));
+        file.read(reinterpret_cast<char*>(&x), sizeof(x));
+        file.read(reinterpret_cast<char*>(&y), sizeof(y));
+        graph.cities_.emplace_back(id, x, y);
+    }
+
+    graph.distanceMatrix_.resize(n);
+    for (std::vector<double>& row : graph.distanceMatrix_) {
+        if (!file) {
+            break;
+        }
+        row.resize(n);
+        file.read(reinterpret_cast<char*>(row.data()),
+                  static_cast<std::streamsize>(n * sizeof(double)));
+    }
+
+    if (!file) {
+        std::cerr << "Error: Truncated graph cache file: " << filename << std::endl;
+        return Graph();
+    }
+
+    graph.buildCoordinates();
+#ifdef ACO_QUANTIZED_DISTANCES
+    graph.buildScaledDistances();
+#endif
+    return graph;
+}
@@ -32,10 +32,10 @@ bool LocalSearch::twoOpt(Tour& tour, const Graph& graph) {
                 }
 
                 // Calculate improvement delta
-                double delta = calculate2OptDelta(sequence, graph, i, j);
+                Length delta = calculate2OptDelta(sequence, graph, i, j);
 
                 // If improvement found, apply it
-                if (delta < -1e-9) {  // Use epsilon for floating point comparison
+                if (delta < -improvementEpsilon(2)) {  // Epsilon for rounding errors
                     reverseTourSegment(sequence, i + 1, j);
                     improved = true;
                     anyImprovement = true;
@@ -54,7 +54,7 @@ bool LocalSearch::twoOpt(Tour& tour, const Graph& graph) {
     return anyImprovement;
 }
 
-double LocalSearch::calculate2OptDelta(const std::vector<int>& sequence,
+LocalSearch::Length LocalSearch::calculate2OptDelta(const std::vector<int>& sequence,
                                        const Graph& graph, int i, int j) {
     int n = static_cast<int>(sequence.size());
 
@@ -65,12 +65,12 @@ double LocalSearch::calculate2OptDelta(const std::vector<int>& sequence,
     int city_j_plus_1 = sequence[(j + 1) % n];  // Wrap around for last city
 
     // Old distance: i->i+1 and j->j+1
-    double oldDistance = graph.getDistance(city_i, city_i_plus_1) +
-                        graph.getDistance(city_j, city_j_plus_1);
+    Length oldDistance = edgeLength(graph, city_i, city_i_plus_1) +
+                         edgeLength(graph, city_j, city_j_plus_1);
 
     // New distance after reversing segment: i->j and i+1->j+1
-    double newDistance = graph.getDistance(city_i, city_j) +
-                        graph.getDistance(city_i_plus_1, city_j_plus_1);
+    Length newDistance = edgeLength(graph, city_i, city_j) +
+                         edgeLength(graph, city_i_plus_1, city_j_plus_1);
 
     return newDistance - oldDistance;
 }
@@ -111,7 +111,7 @@ bool LocalSearch::threeOpt(Tour& tour, const Graph& graph) {
 
     while (improved) {
         improved = false;
-        double bestDelta = 0.0;
+        Length bestDelta = 0;
         int best_i = -1, best_j = -1, best_k = -1;
         int bestCase = -1;
 
@@ -133,36 +133,38 @@ bool LocalSearch::threeOpt(Tour& tour, const Graph& graph) {
                     int city_k1 = sequence[(k + 1) % n];
 
                     // Current distance of the 3 edges
-                    double oldDist = graph.getDistance(city_i, city_i1) +
-                                    graph.getDistance(city_j, city_j1) +
-                                    graph.getDistance(city_k, city_k1);
+                    Length oldDist = edgeLength(graph, city_i, city_i1) +
+                                     edgeLength(graph, city_j, city_j1) +
+                                     edgeLength(graph, city_k, city_k1);
 
                     // Try all 7 possible reconnection patterns (case 0 is original)
                     // Case 1: Reverse segment (i+1, j)
-                    double case1 = graph.getDistance(city_i, city_j) +
-                                  graph.getDistance(city_i1, city_j1) +
-                                  graph.getDistance(city_k, city_k1);
+                    Length case1 = edgeLength(graph, city_i, city_j) +
+                                   edgeLength(graph, city_i1, city_j1) +
+                                   edgeLength(graph, city_k, city_k1);
 
                     // Case 2: Reverse segment (j+1, k)
-                    double case2 = graph.getDistance(city_i, city_i1) +
-                                  graph.getDistance(city_j, city_k) +
-                                  graph.getDistance(city_j1, city_k1);
+                    Length case2 = edgeLength(graph, city_i, city_i1) +
+                                   edgeLength(graph, city_j, city_k) +
+                                   edgeLength(graph, city_j1, city_k1);
 
                     // Case 3: Reverse both segments
-                    double case3 = graph.getDistance(city_i, city_j) +
-                                  graph.getDistance(city_i1, city_k) +
-                                  graph.getDistance(city_j1, city_k1);
+                    Length case3 = edgeLength(graph, city_i, city_j) +
+                                   edgeLength(graph, city_i1, city_k) +
+                                   edgeLength(graph, city_j1, city_k1);
 
                     // Case 4: Swap segments (i+1,j) and (j+1,k)
-                    double case4 = graph.getDistance(city_i, city_j1) +
-                                  graph.getDistance(city_k, city_i1) +
-                                  graph.getDistance(city_j, city_k1);
-
-                    // Find best case
-                    double cases[] = {case1, case2, case3, case4};
+                    Length case4 = edgeLength(graph, city_i, city_j1) +
+                                   edgeLength(graph, city_k, city_i1) +
+                                   edgeLength(graph, city_j, city_k1);
+
+                    // Find best case. Cases 1 and 2 keep one of the three
+                    // edges, so they only change two
+                    Length cases[] = {case1, case2, case3, case4};
+                    const int changedEdges[] = {2, 2, 3, 3};
                     for (int c = 0; c < 4; ++c) {
-                        double delta = cases[c] - oldDist;
-                        if (delta < bestDelta - 1e-9) {  // Epsilon for floating point
+                        Length delta = cases[c] - oldDist;
+                        if (delta < bestDelta - improvementEpsilon(changedEdges[c])) {  // Epsilon for rounding errors
                             bestDelta = delta;
                             best_i = i;
                             best_j = j;
@@ -0,0 +1,62 @@
+#include "ProgressBuffer.h"
+
+ProgressBuffer::ProgressBuffer(std::size_t capacity) {
+    std::size_t size = 1;
+    while (size < capacity) {
+        size <<= 1;
+    }
+    records_.resize(size);
+    mask_ = size - 1;
+}
+
+bool ProgressBuffer::push(const ProgressRecord& record) {
+    std::size_t head = head_.load(std::memory_order_relaxed);
+    std::size_t tail = tail_.load(std::memory_order_acquire);
+
+    if (head - tail == records_.size()) {
+        dropped_.fetch_add(1, std::memory_order_relaxed);
+        return false;
+    }
+
+    records_[head & mask_] = record;
+    head_.store(head + 1, std::memory_order_release);
+    return true;
+}
+
+void ProgressBuffer::publishTour(const std::vector<int>& tour) {
+    tours_[tourBack_] = tour;  // Reuses the buffer's capacity after the first few tours
+    int previous = tourMiddle_.exchange(tourBack_ | kDirty, std::memory_order_acq_rel);
+    tourBack_ = previous & ~kDirty;
+}
+
+std::size_t ProgressBuffer::drain(std::vector<ProgressRecord>& out) {
+    std::size_t tail = tail_.load(std::memory_order_relaxed);
+    std::size_t head = head_.load(std::memory_order_acquire);
+
+    out.reserve(out.size() + (head - tail));
+    for (std::size_t i = tail; i != head; ++i) {
+        out.push_back(records_[i & mask_]);
+    }
+
+    tail_.store(head, std::memory_order_release);
+    return head - tail;
+}
+
+bool ProgressBuffer::takeTour(std::vector<int>& out) {
+    if (!(tourMiddle_.load(std::memory_order_relaxed) & kDirty)) {
+        return false;
+    }
+
+    int previous = tourMiddle_.exchange(tourFront_, std::memory_order_acq_rel);
+    tourFront_ = previous & ~kDirty;
+    out = tours_[tourFront_];
+    return true;
+}
+
+void ProgressBuffer::clear() {
+    head_.store(0, std::memory_order_relaxed);
+    tail_.store(0, std::memory_order_relaxed);
+    dropped_.store(0, std::memory_order_relaxed);
+    tourMiddle_.store(tourMiddle_.load(std::memory_order_relaxed) & ~kDirty,
+                      std::memory_order_relaxed);
+}
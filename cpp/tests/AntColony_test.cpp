@@ -3,6 +3,10 @@
 #include "Graph.h"
 #include "City.h"
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 // Helper function to create a simple triangle graph
 Graph createTriangleGraph() {
     std::vector<City> cities = {
@@ -46,6 +50,18 @@ TEST(AntColonyTest, Initialize) {
     EXPECT_EQ(colony.getConvergenceData().size(), 0);
 }
 
+// Test that τ₀ = numAnts / nearest neighbor tour length is fixed at construction
+TEST(AntColonyTest, InitialPheromone) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+
+    EXPECT_DOUBLE_EQ(colony.getInitialPheromone(), 5.0 / graph.nearestNeighborTourLength());
+
+    colony.solve(5);
+    colony.reset(2.0, 3.0, 0.1, 10.0);
+    EXPECT_DOUBLE_EQ(colony.getInitialPheromone(), 5.0 / graph.nearestNeighborTourLength());
+}
+
 // Test constructSolutions
 TEST(AntColonyTest, ConstructSolutions) {
     Graph graph = createTriangleGraph();
@@ -308,6 +324,32 @@ TEST(AntColonyTest, MultipleSolveCalls) {
     EXPECT_EQ(colony.getConvergenceData().size(), 10);  // Should reset
 }
 
+// Test reset changes parameters and clears the previous run
+TEST(AntColonyTest, Reset) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    colony.setUseProgressBuffer(true);
+    colony.solve(5);
+
+    colony.reset(2.0, 3.0, 0.1, 50.0);
+    EXPECT_EQ(colony.getNumAnts(), 5);
+    EXPECT_DOUBLE_EQ(colony.getAlpha(), 2.0);
+    EXPECT_DOUBLE_EQ(colony.getBeta(), 3.0);
+    EXPECT_DOUBLE_EQ(colony.getRho(), 0.1);
+    EXPECT_DOUBLE_EQ(colony.getQ(), 50.0);
+    EXPECT_EQ(colony.getConvergenceData().size(), 0);
+
+    // Undrained records from the previous run are discarded
+    std::vector<ProgressRecord> records;
+    ASSERT_NE(colony.getProgressBuffer(), nullptr);
+    EXPECT_EQ(colony.getProgressBuffer()->drain(records), 0);
+
+    // The colony can be solved again with the new parameters
+    Tour tour = colony.solve(5);
+    EXPECT_TRUE(tour.validate(4));
+    EXPECT_EQ(colony.getConvergenceData().size(), 5);
+}
+
 // Test parameter getters
 TEST(AntColonyTest, ParameterGetters) {
     Graph graph = createTriangleGraph();
@@ -450,6 +492,20 @@ TEST(AntColonyTest, AutoThreadDetection) {
     EXPECT_GT(bestTour.getDistance(), 0.0);
 }
 
+#ifdef _OPENMP
+// Test that numThreads = 0 undoes an earlier explicit count (reused colonies)
+TEST(AntColonyTest, AutoThreadsAfterExplicitCount) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 10, 1.0, 2.0, 0.5, 100.0);
+
+    colony.setNumThreads(2);
+    EXPECT_EQ(omp_get_max_threads(), 2);
+
+    colony.setNumThreads(0);
+    EXPECT_EQ(omp_get_max_threads(), omp_get_num_procs());
+}
+#endif
+
 // ==================== Elitist Strategy Tests ====================
 
 // Test basic elitist strategy enables correctly
@@ -619,3 +675,105 @@ TEST(AntColonyTest, ElitistConvergence) {
         bestSoFar = std::min(bestSoFar, dist);
     }
 }
+
+// Test progress buffer is disabled by default
+TEST(AntColonyTest, ProgressBufferDisabledByDefault) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    EXPECT_EQ(colony.getProgressBuffer(), nullptr);
+
+    colony.setUseProgressBuffer(true);
+    EXPECT_NE(colony.getProgressBuffer(), nullptr);
+    colony.setUseProgressBuffer(false);
+    EXPECT_EQ(colony.getProgressBuffer(), nullptr);
+}
+
+// Test progress buffer records every iteration and the best tour
+TEST(AntColonyTest, ProgressBufferRecordsEveryIteration) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    colony.setUseProgressBuffer(true);
+
+    Tour bestTour = colony.solve(25);
+
+    std::vector<ProgressRecord> records;
+    ASSERT_EQ(colony.getProgressBuffer()->drain(records), 25);
+
+    const auto& convergence = colony.getConvergenceData();
+    for (int i = 0; i < 25; ++i) {
+        EXPECT_EQ(records[i].iteration, i + 1);
+        EXPECT_DOUBLE_EQ(records[i].iterationBest, convergence[i]);
+        EXPECT_LE(records[i].bestDistance, records[i].iterationBest);
+    }
+    EXPECT_DOUBLE_EQ(records.back().bestDistance, bestTour.getDistance());
+
+    std::vector<int> tour;
+    ASSERT_TRUE(colony.getProgressBuffer()->takeTour(tour));
+    EXPECT_EQ(tour, bestTour.getSequence());
+}
+
+// Test progress buffer in convergence mode
+TEST(AntColonyTest, ProgressBufferConvergenceMode) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    colony.setUseProgressBuffer(true);
+    colony.setConvergenceThreshold(10);
+
+    colony.solve(-1);
+
+    std::vector<ProgressRecord> records;
+    colony.getProgressBuffer()->drain(records);
+    EXPECT_EQ(records.size(), colony.getConvergenceData().size());
+}
+
+// Test convergence mode stops exactly at the no-improvement threshold
+TEST(AntColonyTest, IterationsWithoutImprovementConvergence) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    EXPECT_EQ(colony.getIterationsWithoutImprovement(), 0);
+
+    colony.setConvergenceThreshold(15);
+    colony.solve(-1);
+
+    EXPECT_EQ(colony.getIterationsWithoutImprovement(), 15);
+}
+
+// Test no-improvement counter in fixed-iteration mode
+TEST(AntColonyTest, IterationsWithoutImprovementFixed) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    colony.solve(30);
+
+    // Count trailing iterations after the last improvement of the running best
+    const auto& convergence = colony.getConvergenceData();
+    double best = std::numeric_limits<double>::max();
+    int expected = 0;
+    for (double distance : convergence) {
+        if (distance < best) {
+            best = distance;
+            expected = 0;
+        } else {
+            expected++;
+        }
+    }
+    EXPECT_EQ(colony.getIterationsWithoutImprovement(), expected);
+}
+
+// Test solve() reports its duration and per-iteration timestamps
+TEST(AntColonyTest, ElapsedTime) {
+    Graph graph = createSquareGraph();
+    AntColony colony(graph, 5, 1.0, 2.0, 0.5, 100.0);
+    EXPECT_DOUBLE_EQ(colony.getElapsedMs(), 0.0);
+
+    colony.setUseProgressBuffer(true);
+    colony.solve(20);
+    EXPECT_GT(colony.getElapsedMs(), 0.0);
+
+    std::vector<ProgressRecord> records;
+    colony.getProgressBuffer()->drain(records);
+    ASSERT_EQ(records.size(), 20);
+    for (size_t i = 1; i < records.size(); ++i) {
+        EXPECT_GE(records[i].elapsedMs, records[i - 1].elapsedMs);
+    }
+    EXPECT_LE(records.back().elapsedMs, colony.getElapsedMs());
+}
@@ -1,6 +1,12 @@
 #include <gtest/gtest.h>
 #include "Graph.h"
 #include "City.h"
+#include <cmath>
+#include <cstdint>
+#include <cstdio>
+#include <fstream>
+#include <iterator>
+#include <string>
 #include <vector>
 
 // Test empty graph
@@ -113,6 +119,49 @@ TEST(GraphTest, GetCities) {
     }
 }
 
+// Test getCoordinates returns all x, then all y, in city order
+TEST(GraphTest, GetCoordinates) {
+    std::vector<City> cities;
+    cities.push_back(City(0, 10.0, 20.0));
+    cities.push_back(City(1, 30.0, 40.0));
+    cities.push_back(City(2, 50.0, 60.0));
+
+    Graph graph(cities);
+
+    const std::vector<double>& coords = graph.getCoordinates();
+    ASSERT_EQ(coords.size(), 6);
+    for (size_t i = 0; i < cities.size(); ++i) {
+        EXPECT_DOUBLE_EQ(coords[i], cities[i].getX());
+        EXPECT_DOUBLE_EQ(coords[cities.size() + i], cities[i].getY());
+    }
+
+    // getXs/getYs point into the two halves
+    EXPECT_EQ(graph.getXs(), coords.data());
+    EXPECT_EQ(graph.getYs(), coords.data() + 3);
+    EXPECT_DOUBLE_EQ(graph.getXs()[2], 50.0);
+    EXPECT_DOUBLE_EQ(graph.getYs()[2], 60.0);
+
+    // Empty graph has no coordinates
+    Graph empty(std::vector<City>{});
+    EXPECT_TRUE(empty.getCoordinates().empty());
+}
+
+// Test distance matrix matches City::distanceTo() exactly
+TEST(GraphTest, DistancesMatchCityDistanceTo) {
+    std::vector<City> cities;
+    for (int i = 0; i < 20; ++i) {
+        cities.push_back(City(i, 13.7 * i - 0.3 * i * i, 5.1 * ((i * 7) % 11)));
+    }
+
+    Graph graph(cities);
+
+    for (int i = 0; i < 20; ++i) {
+        for (int j = 0; j < 20; ++j) {
+            EXPECT_EQ(graph.getDistance(i, j), cities[i].distanceTo(cities[j]));
+        }
+    }
+}
+
 // Test invalid indices (basic error handling)
 TEST(GraphTest, InvalidIndices) {
     std::vector<City> cities;
@@ -127,3 +176,86 @@ TEST(GraphTest, InvalidIndices) {
     EXPECT_DOUBLE_EQ(graph.getDistance(2, 0), 0.0);
     EXPECT_DOUBLE_EQ(graph.getDistance(0, 2), 0.0);
 }
+
+// Test save()/load() round-trips cities and distances exactly
+TEST(GraphTest, SaveLoadRoundTrip) {
+    std::vector<City> cities;
+    for (int i = 0; i < 15; ++i) {
+        cities.push_back(City(i + 1, 7.3 * i - 0.2 * i * i, 3.9 * ((i * 5) % 7)));
+    }
+    Graph graph(cities);
+    const std::string path = "graph_roundtrip.cache";
+
+    ASSERT_TRUE(graph.save(path));
+    Graph loaded = Graph::load(path);
+    std::remove(path.c_str());
+
+    ASSERT_EQ(loaded.getNumCities(), graph.getNumCities());
+    EXPECT_EQ(loaded.getCoordinates(), graph.getCoordinates());
+    for (int i = 0; i < 15; ++i) {
+        EXPECT_EQ(loaded.getCity(i).getId(), i + 1);
+        for (int j = 0; j < 15; ++j) {
+            EXPECT_EQ(loaded.getDistance(i, j), graph.getDistance(i, j));
+        }
+    }
+}
+
+// Test load() rejects missing, foreign and truncated files
+TEST(GraphTest, LoadInvalidCache) {
+    EXPECT_FALSE(Graph::load("non_existent_graph.cache").isValid());
+
+    const std::string path = "graph_invalid.cache";
+    {
+        std::ofstream file(path, std::ios::binary);
+        file << "NAME: not a cache";
+    }
+    EXPECT_FALSE(Graph::load(path).isValid());
+
+    std::vector<City> cities = {City(0, 0.0, 0.0), City(1, 3.0, 4.0), City(2, 6.0, 8.0)};
+    ASSERT_TRUE(Graph(cities).save(path));
+    {
+        // Drop the last distance
+        std::ifstream in(path, std::ios::binary);
+        std::string bytes((std::istreambuf_iterator<char>(in)), std::istreambuf_iterator<char>());
+        std::ofstream out(path, std::ios::binary | std::ios::trunc);
+        out.write(bytes.data(), static_cast<std::streamsize>(bytes.size() - sizeof(double)));
+    }
+    EXPECT_FALSE(Graph::load(path).isValid());
+
+    {
+        // Valid header claiming far more cities than the file holds
+        std::string bytes("ACOG", 4);
+        const std::uint32_t header[2] = {1, 0xFFFFFFF0u};
+        bytes.append(reinterpret_cast<const char*>(header), sizeof(header));
+        std::ofstream out(path, std::ios::binary | std::ios::trunc);
+        out.write(bytes.data(), static_cast<std::streamsize>(bytes.size()));
+    }
+    EXPECT_FALSE(Graph::load(path).isValid());
+    std::remove(path.c_str());
+}
+
+#ifdef ACO_QUANTIZED_DISTANCES
+// Test the fixed-point matrix rounds every distance at the scale
+TEST(GraphTest, ScaledDistances) {
+    std::vector<City> cities = {City(0, 0.0, 0.0), City(1, 3.0, 4.0), City(2, 1.0, 1.0)};
+    Graph graph(cities);
+
+    EXPECT_DOUBLE_EQ(graph.getDistanceScale(), ACO_DISTANCE_SCALE);
+    EXPECT_EQ(graph.getScaledDistance(0, 1), 5 * ACO_DISTANCE_SCALE);
+    for (int i = 0; i < 3; ++i) {
+        for (int j = 0; j < 3; ++j) {
+            EXPECT_EQ(graph.getScaledDistance(i, j),
+                      std::llround(graph.getDistance(i, j) * graph.getDistanceScale()));
+        }
+    }
+}
+
+// Test the scale drops so very long distances still fit in an int32
+TEST(GraphTest, ScaledDistancesFitInt32) {
+    std::vector<City> cities = {City(0, 0.0, 0.0), City(1, 3.0e7, 4.0e7)};
+    Graph graph(cities);
+
+    EXPECT_LT(graph.getDistanceScale(), ACO_DISTANCE_SCALE);
+    EXPECT_GT(graph.getScaledDistance(0, 1), 0);
+}
+#endif
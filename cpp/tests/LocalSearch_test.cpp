@@ -118,6 +118,47 @@ TEST_F(LocalSearchTest, TwoOptMonotonicImprovement) {
     EXPECT_TRUE(tour.validate(5));
 }
 
+#ifdef ACO_QUANTIZED_DISTANCES
+// Test 2-opt rejects a move that only looks shorter after quantization
+TEST_F(LocalSearchTest, TwoOptIgnoresRoundingOnlyImprovement) {
+    // Reversing (1,3) makes the tour 0.0004 longer, but the scaled
+    // edge lengths (3162 + 10612 - 6951 - 6824) give a delta of -1
+    std::vector<City> cities = {
+        City(0, 0.0, 0.0),
+        City(1, 2.25, 3.0),
+        City(2, 7.75, 7.25),
+        City(3, 3.25, 6.0)
+    };
+    Graph graph(cities);
+    std::vector<int> sequence = {0, 1, 2, 3};
+    double initialDistance = calculateDistance(sequence, graph);
+    Tour tour(sequence, initialDistance);
+
+    EXPECT_FALSE(LocalSearch::twoOpt(tour, graph));
+    EXPECT_DOUBLE_EQ(tour.getDistance(), initialDistance);
+}
+
+// Test 2-opt still applies a real improvement just past the rounding margin
+TEST_F(LocalSearchTest, TwoOptAppliesSmallImprovement) {
+    // Reversing (1,3) makes the tour 0.0035 shorter; its scaled delta is -3,
+    // beyond the 2 units that rounding four edges can account for
+    std::vector<City> cities = {
+        City(0, 0.0, 0.0),
+        City(1, 2.175, 1.575),
+        City(2, 4.375, 2.925),
+        City(3, 7.25, 5.4)
+    };
+    Graph graph(cities);
+    std::vector<int> sequence = {0, 1, 2, 3};
+    double initialDistance = calculateDistance(sequence, graph);
+    Tour tour(sequence, initialDistance);
+
+    EXPECT_TRUE(LocalSearch::twoOpt(tour, graph));
+    EXPECT_LT(tour.getDistance(), initialDistance);
+    EXPECT_TRUE(tour.validate(4));
+}
+#endif
+
 // Test 3-opt on trivially small tour
 TEST_F(LocalSearchTest, ThreeOptTooSmall) {
     std::vector<int> sequence = {0, 1, 2, 3};
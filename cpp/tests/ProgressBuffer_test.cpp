@@ -0,0 +1,115 @@
+#include <gtest/gtest.h>
+#include "ProgressBuffer.h"
+#include <thread>
+
+// Test capacity is rounded up to a power of two
+TEST(ProgressBufferTest, CapacityRoundedUp) {
+    ProgressBuffer buffer(100);
+    EXPECT_EQ(buffer.getCapacity(), 128);
+    EXPECT_EQ(buffer.getDroppedCount(), 0);
+}
+
+// Test records are drained in push order
+TEST(ProgressBufferTest, DrainInOrder) {
+    ProgressBuffer buffer(8);
+    for (int i = 1; i <= 5; ++i) {
+        EXPECT_TRUE(buffer.push({i, 100.0 - i, 90.0, 10.0 * i}));
+    }
+
+    std::vector<ProgressRecord> records;
+    EXPECT_EQ(buffer.drain(records), 5);
+    ASSERT_EQ(records.size(), 5);
+    for (int i = 0; i < 5; ++i) {
+        EXPECT_EQ(records[i].iteration, i + 1);
+        EXPECT_DOUBLE_EQ(records[i].iterationBest, 99.0 - i);
+        EXPECT_DOUBLE_EQ(records[i].bestDistance, 90.0);
+        EXPECT_DOUBLE_EQ(records[i].elapsedMs, 10.0 * (i + 1));
+    }
+
+    // Nothing left after draining
+    EXPECT_EQ(buffer.drain(records), 0);
+    EXPECT_EQ(records.size(), 5);
+}
+
+// Test push fails and counts drops when the ring is full
+TEST(ProgressBufferTest, DropsWhenFull) {
+    ProgressBuffer buffer(4);
+    for (int i = 1; i <= 4; ++i) {
+        EXPECT_TRUE(buffer.push({i, 1.0, 1.0, 0.0}));
+    }
+    EXPECT_FALSE(buffer.push({5, 1.0, 1.0, 0.0}));
+    EXPECT_EQ(buffer.getDroppedCount(), 1);
+
+    // Draining frees the slots again
+    std::vector<ProgressRecord> records;
+    EXPECT_EQ(buffer.drain(records), 4);
+    EXPECT_TRUE(buffer.push({6, 1.0, 1.0, 0.0}));
+}
+
+// Test only the latest published tour is returned, and only once
+TEST(ProgressBufferTest, TakeLatestTour) {
+    ProgressBuffer buffer;
+    std::vector<int> tour;
+    EXPECT_FALSE(buffer.takeTour(tour));
+
+    buffer.publishTour({0, 1, 2});
+    buffer.publishTour({2, 1, 0});
+    EXPECT_TRUE(buffer.takeTour(tour));
+    EXPECT_EQ(tour, (std::vector<int>{2, 1, 0}));
+    EXPECT_FALSE(buffer.takeTour(tour));
+
+    buffer.publishTour({1, 0, 2});
+    EXPECT_TRUE(buffer.takeTour(tour));
+    EXPECT_EQ(tour, (std::vector<int>{1, 0, 2}));
+}
+
+// Test clear discards pending records and tours
+TEST(ProgressBufferTest, Clear) {
+    ProgressBuffer buffer(8);
+    buffer.push({1, 1.0, 1.0, 0.0});
+    buffer.publishTour({0, 1});
+    buffer.clear();
+
+    std::vector<ProgressRecord> records;
+    std::vector<int> tour;
+    EXPECT_EQ(buffer.drain(records), 0);
+    EXPECT_FALSE(buffer.takeTour(tour));
+}
+
+// Test a producer and a consumer thread running concurrently
+TEST(ProgressBufferTest, ConcurrentProducerConsumer) {
+    const int numRecords = 100000;
+    ProgressBuffer buffer(256);
+
+    std::thread producer([&buffer]() {
+        for (int i = 1; i <= numRecords; ++i) {
+            while (!buffer.push({i, static_cast<double>(i), static_cast<double>(i), 0.0})) {
+                std::this_thread::yield();
+            }
+            if (i % 1000 == 0) {
+                buffer.publishTour({i, i + 1, i + 2});
+            }
+        }
+    });
+
+    std::vector<ProgressRecord> records;
+    std::vector<int> tour;
+    int lastTourStart = 0;
+    while (records.size() < static_cast<size_t>(numRecords)) {
+        buffer.drain(records);
+        if (buffer.takeTour(tour)) {
+            // Tours are never torn and never go backwards
+            ASSERT_EQ(tour.size(), 3);
+            EXPECT_EQ(tour[1], tour[0] + 1);
+            EXPECT_EQ(tour[2], tour[0] + 2);
+            EXPECT_GT(tour[0], lastTourStart);
+            lastTourStart = tour[0];
+        }
+    }
+    producer.join();
+
+    ASSERT_EQ(records.size(), static_cast<size_t>(numRecords));
+    for (int i = 0; i < numRecords; ++i) {
+        EXPECT_EQ(records[i].iteration, i + 1);
+    }
+}
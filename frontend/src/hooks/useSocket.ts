@@ -128,24 +128,40 @@ export function useSocket(): UseSocketReturn {
       addLog(`Preview: ${data.benchmark} (${data.numCities} cities)`)
     })
 
-    socket.on("progress", (data: { iteration: number; bestDistance: number; bestTour: number[]; progress: number; elapsedTime?: number }) => {
-      setCurrentIteration(data.iteration)
-      setBestDistance(data.bestDistance)
-      setBestTour(data.bestTour)
-      setConvergenceData((prev) => [...prev, { iteration: data.iteration, length: data.bestDistance }])
+    // Progress updates arrive batched (~10 per second at most), oldest first
+    socket.on("progress_batch", (batch: { iteration: number; bestDistance: number; bestTour?: number[]; convergenceDelta: number[]; progressPermille: number; elapsedMs?: number; warnings?: string[] }[]) => {
+      if (batch.length === 0) return
+      // Configuration warnings arrive once, with the first batch of a solve
+      for (const warning of batch[0].warnings ?? []) addLog(`⚠ ${warning}`)
+      const latest = batch[batch.length - 1]
+
+      setCurrentIteration(latest.iteration)
+      setBestDistance(latest.bestDistance)
+      // The tour is only sent when it improved; otherwise keep the last one
+      if (latest.bestTour) setBestTour(latest.bestTour)
+      // Each update carries only the global bests since the previous one, ending at data.iteration
+      setConvergenceData((prev) => [
+        ...prev,
+        ...batch.flatMap((data) => {
+          const first = data.iteration - data.convergenceDelta.length + 1
+          return data.convergenceDelta.map((length, i) => ({ iteration: first + i, length }))
+        }),
+      ])
 
       // Show iteration status without repeating distance (we have the graph for that)
-      const timeStr = data.elapsedTime ? ` [${data.elapsedTime.toFixed(1)}s]` : ''
-      addLog(`Running iteration ${data.iteration}...${timeStr}`)
+      for (const data of batch) {
+        const timeStr = data.elapsedMs ? ` [${(data.elapsedMs / 1000).toFixed(1)}s]` : ''
+        addLog(`Running iteration ${data.iteration}...${timeStr}`)
+      }
     })
 
-    socket.on("complete", (data: { bestDistance: number; bestTour: number[]; totalIterations: number; elapsedTime?: number; benchmark?: string; optimalDistance?: number; optimalityGap?: number }) => {
+    socket.on("complete", (data: { bestDistance: number; bestTour: number[]; totalIterations: number; elapsedMs?: number; benchmark?: string; optimalDistance?: number; optimalityGap?: number }) => {
       setIsRunning(false)
       setBestDistance(data.bestDistance)
       setBestTour(data.bestTour)
 
       // Build completion message with solution quality
-      const timeStr = data.elapsedTime ? ` in ${data.elapsedTime.toFixed(2)}s` : ''
+      const timeStr = data.elapsedMs ? ` in ${(data.elapsedMs / 1000).toFixed(2)}s` : ''
       addLog(`✓ Optimization complete${timeStr}`)
       addLog(`  Best distance: ${data.bestDistance.toFixed(2)}`)
 
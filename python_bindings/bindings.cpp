@@ -1,6 +1,10 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+
+#include <memory>
+#include <optional>
 
 #include "City.h"
 #include "Graph.h"
@@ -10,12 +14,44 @@
 #include "Ant.h"
 #include "AntColony.h"
 #include "LocalSearch.h"
+#include "ProgressBuffer.h"
 
 namespace py = pybind11;
 
+// Copy a vector into a new NumPy array that owns its buffer (one memcpy,
+// no per-element Python floats)
+static py::array_t<double> toArray(const std::vector<double>& values) {
+    auto* data = new std::vector<double>(values);
+    py::capsule owner(data, [](void* p) { delete static_cast<std::vector<double>*>(p); });
+    return py::array_t<double>(data->size(), data->data(), owner);
+}
+
+// Wrap a Python progress callback for AntColony, passing the convergence
+// history as a NumPy array. solve() copies the callback with the GIL released,
+// so the Python function is held through a shared_ptr whose deleter takes the GIL
+static AntColony::ProgressCallback wrapProgressCallback(py::function callback) {
+    std::shared_ptr<py::function> fn(
+        new py::function(std::move(callback)),
+        [](py::function* f) { py::gil_scoped_acquire gil; delete f; });
+    return [fn](int iteration, double bestDistance,
+                const std::vector<int>& bestTour,
+                const std::vector<double>& convergence) {
+        py::gil_scoped_acquire gil;
+        (*fn)(iteration, bestDistance, bestTour, toArray(convergence));
+    };
+}
+
 PYBIND11_MODULE(aco_solver, m) {
     m.doc() = "Ant Colony Optimization TSP Solver Python Bindings";
 
+    // Whether the solver was compiled with OpenMP; without it the thread
+    // settings are accepted but every solve runs on one core
+#ifdef _OPENMP
+    m.attr("openmp") = true;
+#else
+    m.attr("openmp") = false;
+#endif
+
     // City class
     py::class_<City>(m, "City")
         .def(py::init<int, double, double>(),
@@ -56,11 +92,49 @@ PYBIND11_MODULE(aco_solver, m) {
              "Get city by index")
         .def("getCities", &Graph::getCities,
              "Get all cities as a list")
+        .def("coordsView", [](py::object self) {
+                 const Graph& g = self.cast<const Graph&>();
+                 const py::ssize_t n = static_cast<py::ssize_t>(g.getNumCities());
+                 const py::ssize_t item = static_cast<py::ssize_t>(sizeof(double));
+                 // Zero-copy view over the graph's planar [xs | ys] storage:
+                 // column 1 starts n doubles after column 0. The graph is the
+                 // array's base, so it outlives the view
+                 py::array_t<double> view({n, static_cast<py::ssize_t>(2)},
+                                          {item, n * item},
+                                          g.getXs(), self);
+                 view.attr("flags").attr("writeable") = false;
+                 return view;
+             },
+             "Get a read-only (n, 2) NumPy view of the city coordinates (no copy)")
+        .def("xs", [](py::object self) {
+                 const Graph& g = self.cast<const Graph&>();
+                 py::array_t<double> view(g.getNumCities(), g.getXs(), self);
+                 view.attr("flags").attr("writeable") = false;
+                 return view;
+             },
+             "Get a read-only NumPy view of all x coordinates (no copy)")
+        .def("ys", [](py::object self) {
+                 const Graph& g = self.cast<const Graph&>();
+                 py::array_t<double> view(g.getNumCities(), g.getYs(), self);
+                 view.attr("flags").attr("writeable") = false;
+                 return view;
+             },
+             "Get a read-only NumPy view of all y coordinates (no copy)")
         .def("isValid", &Graph::isValid,
              "Check if graph has cities")
         .def("nearestNeighborTourLength", &Graph::nearestNeighborTourLength,
              py::arg("startCity") = 0,
              "Calculate tour length using greedy nearest neighbor heuristic")
+        .def("save", &Graph::save,
+             py::arg("filename"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Write cities and the distance matrix to a binary cache file\n\n"
+             "Returns True on success")
+        .def_static("load", &Graph::load,
+             py::arg("filename"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Load a graph written by save() without re-parsing or recomputing distances\n\n"
+             "Returns an empty graph if the file is missing or malformed")
         .def("__repr__", [](const Graph &g) {
             return "<Graph cities=" + std::to_string(g.getNumCities()) + ">";
         });
@@ -95,15 +169,19 @@ PYBIND11_MODULE(aco_solver, m) {
              py::arg("filename"),
              "Construct loader for TSP file (auto-searches data/ directories)")
         .def("loadGraph", &TSPLoader::loadGraph,
+             py::call_guard<py::gil_scoped_release>(),
              "Load graph from file (auto-detects format)")
         .def_static("loadFromCoordinates", &TSPLoader::loadFromCoordinates,
              py::arg("filename"),
+             py::call_guard<py::gil_scoped_release>(),
              "Load graph from coordinate file")
         .def_static("loadFromDistanceMatrix", &TSPLoader::loadFromDistanceMatrix,
              py::arg("filename"),
+             py::call_guard<py::gil_scoped_release>(),
              "Load graph from distance matrix file")
         .def_static("loadFromTSPLIB", &TSPLoader::loadFromTSPLIB,
              py::arg("filename"),
+             py::call_guard<py::gil_scoped_release>(),
              "Load graph from TSPLIB format file");
 
     // PheromoneMatrix class
@@ -144,6 +222,7 @@ PYBIND11_MODULE(aco_solver, m) {
         .def_static("twoOpt", &LocalSearch::twoOpt,
              py::arg("tour"),
              py::arg("graph"),
+             py::call_guard<py::gil_scoped_release>(),
              "Improve tour using 2-opt edge swapping\n\n"
              "Parameters:\n"
              "  tour: Tour to improve (modified in-place)\n"
@@ -153,6 +232,7 @@ PYBIND11_MODULE(aco_solver, m) {
         .def_static("threeOpt", &LocalSearch::threeOpt,
              py::arg("tour"),
              py::arg("graph"),
+             py::call_guard<py::gil_scoped_release>(),
              "Improve tour using 3-opt edge swapping\n\n"
              "Parameters:\n"
              "  tour: Tour to improve (modified in-place)\n"
@@ -163,6 +243,7 @@ PYBIND11_MODULE(aco_solver, m) {
              py::arg("tour"),
              py::arg("graph"),
              py::arg("use3opt") = true,
+             py::call_guard<py::gil_scoped_release>(),
              "Apply both 2-opt and optionally 3-opt in sequence\n\n"
              "Parameters:\n"
              "  tour: Tour to improve (modified in-place)\n"
@@ -220,35 +301,101 @@ PYBIND11_MODULE(aco_solver, m) {
              "  useDistinctStartCities: Each ant starts at different city (default: False)")
         .def("initialize", &AntColony::initialize,
              "Initialize pheromones and ants")
+        .def("reset", &AntColony::reset,
+             py::arg("alpha"),
+             py::arg("beta"),
+             py::arg("rho"),
+             py::arg("Q"),
+             "Change alpha, beta, rho and Q and re-initialize for another run\n\n"
+             "Keeps the graph, settings and progress buffer, so re-solving the same\n"
+             "problem skips constructing a new colony")
         .def("runIteration", &AntColony::runIteration,
+             py::call_guard<py::gil_scoped_release>(),
              "Execute one complete iteration")
         .def("constructSolutions", &AntColony::constructSolutions,
+             py::call_guard<py::gil_scoped_release>(),
              "All ants build tours")
         .def("updatePheromones", &AntColony::updatePheromones,
+             py::call_guard<py::gil_scoped_release>(),
              "Evaporate and deposit pheromones")
-        .def("solve", &AntColony::solve,
+        .def("solve", [](AntColony &ac, int maxIterations, std::optional<py::function> callback) {
+                 // Wrapped while the GIL is held; destroyed after it is re-acquired
+                 AntColony::ProgressCallback progress;
+                 if (callback) {
+                     progress = wrapProgressCallback(std::move(*callback));
+                 }
+                 py::gil_scoped_release release;  // Release GIL during C++ computation
+                 return ac.solve(maxIterations, progress);
+             },
              py::arg("maxIterations"),
-             py::arg("callback") = nullptr,
-             py::call_guard<py::gil_scoped_release>(),  // Release GIL during C++ computation
+             py::arg("callback") = py::none(),
              "Run algorithm for specified iterations\n\n"
              "Parameters:\n"
              "  maxIterations: Number of iterations to run (or -1 for auto-convergence)\n"
-             "  callback: Optional progress callback function\n\n"
+             "  callback: Optional progress callback function, called like the\n"
+             "            setProgressCallback() one (convergence as a NumPy array)\n\n"
              "Returns:\n"
              "  Best tour found")
         .def("getBestTour", &AntColony::getBestTour,
              "Get best solution found")
-        .def("getConvergenceData", &AntColony::getConvergenceData,
-             "Get iteration history")
-        .def("setProgressCallback", &AntColony::setProgressCallback,
+        .def("getConvergenceData", [](const AntColony &ac) {
+                 return toArray(ac.getConvergenceData());
+             },
+             "Get iteration history (best distance per iteration) as a NumPy array")
+        .def("getElapsedMs", &AntColony::getElapsedMs,
+             "Get milliseconds spent in the last solve() (monotonic clock)")
+        .def("getIterationsWithoutImprovement", &AntColony::getIterationsWithoutImprovement,
+             "Get consecutive iterations without improvement at the end of the last solve()")
+        .def("setProgressCallback", [](AntColony &ac, py::function callback) {
+                 ac.setProgressCallback(wrapProgressCallback(std::move(callback)));
+             },
              py::arg("callback"),
-             "Set progress callback function")
+             "Set progress callback function\n\n"
+             "Called as callback(iteration, bestDistance, bestTour, convergence)\n"
+             "where convergence is a NumPy array of iteration best distances")
         .def("setCallbackInterval", &AntColony::setCallbackInterval,
              py::arg("interval"),
              "Set callback interval (default: 10 iterations)")
         .def("setConvergenceThreshold", &AntColony::setConvergenceThreshold,
              py::arg("threshold"),
              "Set convergence threshold (default: 200 iterations without improvement)")
+        .def("setUseProgressBuffer", &AntColony::setUseProgressBuffer,
+             py::arg("enabled"),
+             "Enable/disable the lock-free progress buffer (default: False)\n\n"
+             "When enabled, solve() records every iteration without calling into\n"
+             "Python; read the records from another thread with drainProgress()")
+        .def("drainProgress", [](AntColony &ac) {
+                 ProgressBuffer* buffer = ac.getProgressBuffer();
+                 if (!buffer) {
+                     throw std::runtime_error("Progress buffer is not enabled");
+                 }
+
+                 std::vector<ProgressRecord> records;
+                 buffer->drain(records);
+
+                 py::array_t<double> array({static_cast<py::ssize_t>(records.size()),
+                                            static_cast<py::ssize_t>(4)});
+                 auto view = array.mutable_unchecked<2>();
+                 for (size_t i = 0; i < records.size(); ++i) {
+                     view(i, 0) = records[i].iteration;
+                     view(i, 1) = records[i].iterationBest;
+                     view(i, 2) = records[i].bestDistance;
+                     view(i, 3) = records[i].elapsedMs;
+                 }
+
+                 std::vector<int> tour;
+                 py::object bestTour = py::none();
+                 if (buffer->takeTour(tour)) {
+                     bestTour = py::cast(tour);
+                 }
+
+                 return py::make_tuple(array, bestTour);
+             },
+             "Take all progress recorded since the last call (safe while solve() runs)\n\n"
+             "Returns:\n"
+             "  (records, bestTour): records is an (n, 4) NumPy array of\n"
+             "  [iteration, iterationBest, bestDistance, elapsedMs] rows; bestTour is the\n"
+             "  latest best tour sequence, or None if it has not improved")
         .def("setUseParallel", &AntColony::setUseParallel,
              py::arg("useParallel"),
              "Enable/disable parallel execution (default: True if OpenMP available)\n\n"
@@ -303,6 +450,54 @@ PYBIND11_MODULE(aco_solver, m) {
              "Parameters:\n"
              "  rankSize: Number of top ants that deposit pheromones (default: numAnts/2)\n\n"
              "Note: Only effective when pheromoneMode is 'rank'")
+        .def("configure", [](AntColony &ac, const py::dict &options) {
+                 // One binding call for the whole configuration instead of one
+                 // per setter; None values keep the current setting
+                 for (auto item : options) {
+                     const std::string key = py::cast<std::string>(item.first);
+                     py::handle value = item.second;
+                     if (value.is_none()) {
+                         continue;
+                     }
+
+                     if (key == "useParallel") {
+                         ac.setUseParallel(value.cast<bool>());
+                     } else if (key == "numThreads") {
+                         ac.setNumThreads(value.cast<int>());
+                     } else if (key == "useLocalSearch") {
+                         ac.setUseLocalSearch(value.cast<bool>());
+                     } else if (key == "use3Opt") {
+                         ac.setUse3Opt(value.cast<bool>());
+                     } else if (key == "localSearchMode") {
+                         ac.setLocalSearchMode(value.cast<std::string>());
+                     } else if (key == "useElitist") {
+                         ac.setUseElitist(value.cast<bool>());
+                     } else if (key == "elitistWeight") {
+                         ac.setElitistWeight(value.cast<double>());
+                     } else if (key == "pheromoneMode") {
+                         ac.setPheromoneMode(value.cast<std::string>());
+                     } else if (key == "rankSize") {
+                         ac.setRankSize(value.cast<int>());
+                     } else if (key == "callbackInterval") {
+                         ac.setCallbackInterval(value.cast<int>());
+                     } else if (key == "convergenceThreshold") {
+                         ac.setConvergenceThreshold(value.cast<int>());
+                     } else if (key == "useProgressBuffer") {
+                         ac.setUseProgressBuffer(value.cast<bool>());
+                     } else {
+                         throw py::key_error("Unknown AntColony option: " + key);
+                     }
+                 }
+             },
+             py::arg("options"),
+             "Apply several settings in one call\n\n"
+             "Parameters:\n"
+             "  options: dict keyed by setter name without 'set' (e.g. 'useParallel',\n"
+             "    'numThreads', 'useLocalSearch', 'use3Opt', 'localSearchMode',\n"
+             "    'useElitist', 'elitistWeight', 'pheromoneMode', 'rankSize',\n"
+             "    'callbackInterval', 'convergenceThreshold', 'useProgressBuffer');\n"
+             "    None values are skipped\n\n"
+             "Raises KeyError for unknown options")
         .def("getNumAnts", &AntColony::getNumAnts,
              "Get number of ants")
         .def("getAlpha", &AntColony::getAlpha,
@@ -313,6 +508,8 @@ PYBIND11_MODULE(aco_solver, m) {
              "Get rho parameter")
         .def("getQ", &AntColony::getQ,
              "Get Q parameter")
+        .def("getInitialPheromone", &AntColony::getInitialPheromone,
+             "Get the initial pheromone level (numAnts / nearest neighbor tour length)")
         .def("__repr__", [](const AntColony &ac) {
             return "<AntColony ants=" + std::to_string(ac.getNumAnts()) +
                    " alpha=" + std::to_string(ac.getAlpha()) +
@@ -0,0 +1,90 @@
+"""
+On-disk cache of loaded TSP graphs
+
+get_graph() loads a problem file through a binary copy written by
+Graph.save(), so repeated runs skip parsing the file and rebuilding the
+O(n²) distance matrix. Cache files are keyed on the problem file's resolved
+absolute path, size and modification time, so a different or edited file
+never reuses another file's graph.
+
+Example usage:
+    >>> from graph_cache import get_graph
+    >>> graph = get_graph("data/berlin52.tsp")
+"""
+
+import glob
+import hashlib
+import os
+from pathlib import Path
+
+import aco_solver
+
+# Default cache location (GRAPH_CACHE_DIR overrides it)
+DEFAULT_CACHE_DIR = Path(os.environ.get('GRAPH_CACHE_DIR')
+                         or Path.home() / '.cache' / 'aco_solver' / 'graphs')
+
+# Largest problem written to the cache: a cache file is 8n² bytes
+DEFAULT_MAX_CITIES = 5000
+
+# Directories TSPLoader searches for a relative name, in the same order
+# (findFile in cpp/src/TSPLoader.cpp)
+SEARCH_DIRS = ('', 'data', '../data', '../../data', '../../../data',
+               'tests/data', '../tests/data', '../../tests/data')
+
+
+def resolve_problem_path(path):
+    """Return the absolute path TSPLoader would read for path (None if missing)"""
+    for directory in SEARCH_DIRS:
+        candidate = Path(directory, path)
+        if candidate.exists():
+            return candidate.resolve()
+    return None
+
+
+def get_graph(path, cache_dir=None, max_cities=DEFAULT_MAX_CITIES):
+    """Load the graph for a TSP file, through the graph cache
+
+    Parameters:
+      path: Problem file (any format TSPLoader reads, found the same way)
+      cache_dir: Cache directory (default: DEFAULT_CACHE_DIR)
+      max_cities: Larger problems are loaded but not cached
+
+    Returns:
+      The Graph (empty if the file could not be loaded). Cache I/O
+      failures just fall back to parsing the file.
+    """
+    resolved = resolve_problem_path(path)
+    if resolved is None:
+        # Let TSPLoader report the missing file
+        return aco_solver.TSPLoader(str(path)).loadGraph()
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    stat = resolved.stat()
+    path_key = hashlib.sha1(str(resolved).encode()).hexdigest()[:16]
+    prefix = f'{resolved.name}-{path_key}-'
+    cache = cache_dir / f'{prefix}{stat.st_size}-{stat.st_mtime_ns}.graph'
+
+    if cache.exists():
+        graph = aco_solver.Graph.load(str(cache))
+        if graph.isValid():
+            return graph
+
+    graph = aco_solver.TSPLoader(str(resolved)).loadGraph()
+
+    if graph.isValid() and graph.getNumCities() <= max_cities:
+        # Write to a temporary name first, so concurrent loaders never read a partial file
+        partial = cache.with_name(f'{cache.name}.{os.getpid()}.tmp')
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            if graph.save(str(partial)):
+                os.replace(partial, cache)
+                # Drop entries for older versions of the same file
+                for stale in cache_dir.glob(glob.escape(prefix) + '*.graph'):
+                    if stale != cache:
+                        stale.unlink(missing_ok=True)
+        except OSError:
+            pass  # Read-only location: just don't cache
+        finally:
+            partial.unlink(missing_ok=True)
+
+    return graph
@@ -6,16 +6,23 @@ This script tests all major functionality of the Python bindings:
 - Loading TSPLIB files
 - Creating and running ACO solver
 - Progress callbacks
+- GIL release during solve
+- Progress buffer draining
 - Comparing results with C++ CLI
 """
 
 import sys
+import tempfile
+import threading
 import time
 
+import numpy as np
+
 # Add python_bindings to path
 sys.path.insert(0, '/home/roger/dev/ant_colony/python_bindings')
 
 import aco_solver
+from graph_cache import get_graph
 
 def test_basic_classes():
     """Test basic class instantiation"""
@@ -47,13 +54,16 @@ def test_tsplib_loading():
     print("Test 2: TSPLIB File Loading")
     print("=" * 60)
 
-    # Load a benchmark
-    loader = aco_solver.TSPLoader("data/berlin52.tsp")
-    graph = loader.loadGraph()
+    # Load a benchmark twice through a scratch graph cache: parsed, then cached
+    with tempfile.TemporaryDirectory() as cache_dir:
+        graph = get_graph("data/berlin52.tsp", cache_dir)
+        cached = get_graph("data/berlin52.tsp", cache_dir)
 
     print(f"Loaded: {graph}")
     assert graph.isValid(), "Graph is not valid"
     assert graph.getNumCities() == 52, "Expected 52 cities"
+    assert cached.isValid(), "Cached graph is not valid"
+    assert cached.getDistance(0, 51) == graph.getDistance(0, 51), "Cached graph differs"
 
     # Check nearest neighbor heuristic
     nn_length = graph.nearestNeighborTourLength()
@@ -72,15 +82,15 @@ def test_aco_with_callback(graph):
     # Track callback invocations
     callback_data = []
 
+    # Only record while the solver holds the GIL; printing happens afterwards
     def progress_callback(iteration, best_distance, best_tour, convergence):
         callback_data.append({
             'iteration': iteration,
             'best_distance': best_distance,
             'tour_length': len(best_tour),
-            'convergence_length': len(convergence)
+            'convergence_length': len(convergence),
+            'improvement': convergence[0] - best_distance
         })
-        print(f"  Iteration {iteration:3d}: Best = {best_distance:.2f}, "
-              f"Improvement = {convergence[0] - best_distance:.2f}")
 
     # Create colony
     colony = aco_solver.AntColony(
@@ -96,16 +106,21 @@ def test_aco_with_callback(graph):
     print(f"Parameters: numAnts={colony.getNumAnts()}, "
           f"alpha={colony.getAlpha()}, beta={colony.getBeta()}")
 
-    # Set callback
+    # Set callback (about 10 calls per solve, whatever its length)
+    iterations = 100
     colony.setProgressCallback(progress_callback)
-    colony.setCallbackInterval(10)
+    colony.setCallbackInterval(max(1, iterations // 10))
 
     # Solve
-    print("\nRunning optimization (100 iterations)...")
+    print(f"\nRunning optimization ({iterations} iterations)...")
     start_time = time.time()
-    best_tour = colony.solve(100)
+    best_tour = colony.solve(iterations)
     elapsed = time.time() - start_time
 
+    for data in callback_data:
+        print(f"  Iteration {data['iteration']:3d}: Best = {data['best_distance']:.2f}, "
+              f"Improvement = {data['improvement']:.2f}")
+
     print(f"\nOptimization complete in {elapsed:.3f}s")
     print(f"Best tour: {best_tour}")
     print(f"Best distance: {best_tour.getDistance():.2f}")
@@ -117,7 +132,7 @@ def test_aco_with_callback(graph):
 
     # Verify convergence
     convergence = colony.getConvergenceData()
-    assert len(convergence) == 100, "Convergence data length mismatch"
+    assert len(convergence) == iterations, "Convergence data length mismatch"
     print(f"✓ Convergence data: {len(convergence)} iterations")
 
     # Check improvement
@@ -148,10 +163,98 @@ def test_tour_validation(graph):
     print("✓ Invalid tour fails validation\n")
 
 
+def test_gil_release(graph):
+    """Test that solve() releases the GIL and re-acquires it only for callbacks"""
+    print("=" * 60)
+    print("Test 5: GIL Release During Solve")
+    print("=" * 60)
+
+    colony = aco_solver.AntColony(graph, numAnts=20)
+    colony.setUseParallel(False)  # One solver thread; the ticker needs a free core
+
+    callback_count = 0
+
+    def progress_callback(iteration, best_distance, best_tour, convergence):
+        nonlocal callback_count
+        callback_count += 1
+
+    colony.setProgressCallback(progress_callback)
+    colony.setCallbackInterval(10)
+
+    # A Python thread that can only make progress while nobody holds the GIL
+    ticks = 0
+    stop = threading.Event()
+
+    def ticker():
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            time.sleep(0)
+
+    thread = threading.Thread(target=ticker)
+    thread.start()
+    try:
+        ticks_before = ticks
+        colony.solve(200)
+        ticks_during = ticks - ticks_before
+    finally:
+        stop.set()
+        thread.join()
+
+    assert callback_count == 20, f"Expected 20 callbacks, got {callback_count}"
+    assert ticks_during > 100, f"Other thread only ran {ticks_during} times during solve (GIL held?)"
+    print(f"✓ Callback invoked {callback_count} times with the GIL re-acquired")
+    print(f"✓ Other Python thread ran {ticks_during} times during solve")
+
+    # A callback passed to solve() gets the same arguments as setProgressCallback's
+    convergence_types = set()
+    colony.solve(30, lambda iteration, best_distance, best_tour, convergence:
+                 convergence_types.add(type(convergence)))
+    assert convergence_types == {np.ndarray}, f"Convergence passed as {convergence_types}"
+    print("✓ solve(n, callback) passes convergence as a NumPy array\n")
+
+
+def test_progress_buffer(graph):
+    """Test draining the lock-free progress buffer while solve() runs"""
+    print("=" * 60)
+    print("Test 6: Progress Buffer")
+    print("=" * 60)
+
+    colony = aco_solver.AntColony(graph, numAnts=20)
+    colony.setUseProgressBuffer(True)
+
+    drained = []
+    tours = []
+    stop = threading.Event()
+
+    def drain():
+        while True:
+            finished = stop.is_set()
+            records, tour = colony.drainProgress()
+            drained.extend(records[:, 0].astype(int).tolist())
+            if tour is not None:
+                tours.append(tour)
+            if finished:
+                break
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=drain)
+    thread.start()
+    try:
+        best_tour = colony.solve(100)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert drained == list(range(1, 101)), "Progress records missing or out of order"
+    assert tours and tours[-1] == best_tour.getSequence(), "Latest tour does not match best tour"
+    print(f"✓ Drained {len(drained)} iteration records and {len(tours)} improved tours\n")
+
+
 def benchmark_performance(graph):
     """Benchmark solver performance"""
     print("=" * 60)
-    print("Test 5: Performance Benchmark")
+    print("Test 7: Performance Benchmark")
     print("=" * 60)
 
     iterations_list = [10, 50, 100]
@@ -174,7 +277,8 @@ def main():
     """Run all tests"""
     print("\n" + "=" * 60)
     print("ACO Solver Python Bindings - Test Suite")
-    print("=" * 60 + "\n")
+    print("=" * 60)
+    print(f"OpenMP: {'enabled' if aco_solver.openmp else 'DISABLED (solves run on one core)'}\n")
 
     try:
         # Run tests
@@ -182,6 +286,8 @@ def main():
         graph = test_tsplib_loading()
         best_tour = test_aco_with_callback(graph)
         test_tour_validation(graph)
+        test_gil_release(graph)
+        test_progress_buffer(graph)
         benchmark_performance(graph)
 
         print("=" * 60)
@@ -2,13 +2,17 @@
 """Test script to verify local search works through the web API stack"""
 
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
 sys.path.insert(0, 'python_bindings')
 
 import aco_solver
+from graph_cache import get_graph
 
-# Load a small problem
-loader = aco_solver.TSPLoader("berlin52.tsp")
-graph = loader.loadGraph()
+# Load a small problem (through a scratch on-disk graph cache)
+with tempfile.TemporaryDirectory() as cache_dir:
+    graph = get_graph("data/berlin52.tsp", cache_dir)
 
 if not graph.isValid():
     print("ERROR: Failed to load graph")
@@ -16,35 +20,35 @@ if not graph.isValid():
 
 print(f"✓ Loaded berlin52: {graph.getNumCities()} cities")
 
-# Create colony
-colony = aco_solver.AntColony(graph, 20, 1.0, 2.0, 0.5, 100.0)
-
-# Test WITHOUT local search
-colony.setUseLocalSearch(False)
-colony.initialize()
-tour_no_ls = colony.solve(50)
-print(f"✓ Without local search: {tour_no_ls.getDistance():.2f}")
-
-# Test WITH local search (best mode)
-colony.setUseLocalSearch(True)
-colony.setUse3Opt(True)
-colony.setLocalSearchMode("best")
-colony.initialize()
-tour_with_ls_best = colony.solve(50)
-print(f"✓ With local search (best mode): {tour_with_ls_best.getDistance():.2f}")
-
-# Test WITH local search (all mode)
-colony.setLocalSearchMode("all")
-colony.initialize()
-tour_with_ls_all = colony.solve(50)
-print(f"✓ With local search (all mode): {tour_with_ls_all.getDistance():.2f}")
-
-# Test 2-opt only
-colony.setUse3Opt(False)
-colony.setLocalSearchMode("best")
-colony.initialize()
-tour_2opt_only = colony.solve(50)
-print(f"✓ With 2-opt only: {tour_2opt_only.getDistance():.2f}")
+# Local search configurations under test: (label, useLocalSearch, use3Opt, mode)
+CONFIGS = [
+    ("Without local search", False, True, "best"),
+    ("With local search (best mode)", True, True, "best"),
+    ("With local search (all mode)", True, True, "all"),
+    ("With 2-opt only", True, False, "best"),
+]
+
+
+def make_colony(use_local_search, use_3opt, mode):
+    """Build an independent colony so the configurations share no state"""
+    colony = aco_solver.AntColony(graph, 20, 1.0, 2.0, 0.5, 100.0)
+    # Each configuration gets one core; the thread pool provides the parallelism
+    colony.setUseParallel(False)
+    colony.setUseLocalSearch(use_local_search)
+    colony.setUse3Opt(use_3opt)
+    colony.setLocalSearchMode(mode)
+    return colony
+
+
+# solve() releases the GIL, so the four runs execute concurrently
+with ThreadPoolExecutor(max_workers=len(CONFIGS)) as pool:
+    futures = [pool.submit(make_colony(*options).solve, 50) for _, *options in CONFIGS]
+    tours = [future.result() for future in futures]
+
+for (label, *_), tour in zip(CONFIGS, tours):
+    print(f"✓ {label}: {tour.getDistance():.2f}")
+
+tour_no_ls, tour_with_ls_best, tour_with_ls_all, tour_2opt_only = tours
 
 # Verify local search improves solutions
 improvement = tour_no_ls.getDistance() - tour_with_ls_best.getDistance()